@@ -136,11 +136,12 @@ class UnifiedKnowledgeStore:
                     source=extraction.source,
                 )
 
-            # Add relationship to nodes (using resolved names)
+            # Add relationship to nodes (using resolved names); the role is
+            # known here, so skip add_relationship's name comparison
             if resolved_subject in self.name_to_id:
-                self.nodes[self.name_to_id[resolved_subject]].add_relationship(normalized_rel)
+                self.nodes[self.name_to_id[resolved_subject]].add_subject_relationship(normalized_rel)
             if resolved_object in self.name_to_id:
-                self.nodes[self.name_to_id[resolved_object]].add_relationship(normalized_rel)
+                self.nodes[self.name_to_id[resolved_object]].add_object_relationship(normalized_rel)
 
             # Store relationship and signature
             self.relationships.append(normalized_rel)
@@ -346,11 +347,11 @@ class UnifiedKnowledgeStore:
             rel_signature = f"{rel.subject}|{rel.predicate}|{rel.object}"
             self.relationship_signatures.add(rel_signature)
 
-            # Add to nodes
+            # Add to nodes; the role is known here
             if rel.subject in self.name_to_id:
-                self.nodes[self.name_to_id[rel.subject]].add_relationship(rel)
+                self.nodes[self.name_to_id[rel.subject]].add_subject_relationship(rel)
             if rel.object in self.name_to_id:
-                self.nodes[self.name_to_id[rel.object]].add_relationship(rel)
+                self.nodes[self.name_to_id[rel.object]].add_object_relationship(rel)
 
         # Load other data
         self.processed_sources = set(data.get("processed_sources", []))
@@ -6,10 +6,16 @@ Combines concepts from knowledge mining with SPO relationships.
 
 from dataclasses import dataclass
 from dataclasses import field
+from operator import attrgetter
 from typing import Any
 
+# Single C-level getter for serializing relationships without per-attribute
+# Python lookups (slotted dataclasses have no __dict__ to copy)
+_REL_KEYS = ("subject", "predicate", "object", "confidence", "source")
+_rel_values = attrgetter(*_REL_KEYS)
 
-@dataclass
+
+@dataclass(slots=True)
 class Relationship:
     """A relationship between two entities in the knowledge graph"""
 
@@ -23,7 +29,7 @@ class Relationship:
         return f"{self.subject} --{self.predicate}--> {self.object}"
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedKnowledgeNode:
     """
     Unified node combining concept definitions with relationships.
@@ -47,8 +53,16 @@ class UnifiedKnowledgeNode:
     metadata: dict[str, Any] = field(default_factory=dict)
     sources: list[str] = field(default_factory=list)
 
+    def add_subject_relationship(self, relationship: Relationship) -> None:
+        """Add a relationship where this node is known to be the subject"""
+        self.relationships_as_subject.append(relationship)
+
+    def add_object_relationship(self, relationship: Relationship) -> None:
+        """Add a relationship where this node is known to be the object"""
+        self.relationships_as_object.append(relationship)
+
     def add_relationship(self, relationship: Relationship) -> None:
-        """Add a relationship to this node"""
+        """Add a relationship to this node, determining its role by name match"""
         if relationship.subject == self.name:
             self.relationships_as_subject.append(relationship)
         elif relationship.object == self.name:
@@ -84,16 +98,7 @@ class UnifiedExtraction:
             "title": self.title,
             "source": self.source,
             "concepts": self.concepts,
-            "relationships": [
-                {
-                    "subject": r.subject,
-                    "predicate": r.predicate,
-                    "object": r.object,
-                    "confidence": r.confidence,
-                    "source": r.source,
-                }
-                for r in self.relationships
-            ],
+            "relationships": [dict(zip(_REL_KEYS, _rel_values(r), strict=True)) for r in self.relationships],
             "key_insights": self.key_insights,
             "code_patterns": self.code_patterns,
             "metadata": self.metadata,
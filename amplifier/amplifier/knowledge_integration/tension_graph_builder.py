@@ -5,7 +5,12 @@ Constructs knowledge graphs that preserve multiple perspectives and productive t
 Follows the principle: Diverse viewpoints enrich understanding. Tensions drive insight.
 """
 
+import gc
+import json
 import logging
+import re
+import sys
+from collections import Counter
 from collections import defaultdict
 from dataclasses import dataclass
 from dataclasses import field
@@ -13,12 +18,24 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore[import-not-found]  # 3-10x faster than stdlib json
+except ImportError:
+    orjson = None
+
 from amplifier.knowledge_integration.models import Relationship
 
 logger = logging.getLogger(__name__)
 
+# Precompiled SPO pattern: one C-level scan over the text instead of
+# per-sentence splits and substring checks
+_TRIPLE_RE = re.compile(
+    r"([^.]+?)\s+(is|has|uses|requires|provides|enables|serves as|delegates to)\s+([^.]+?)(?:\.|$)",
+    re.IGNORECASE,
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class PerspectiveTriple:
     """SPO triple with perspective attribution and metadata."""
 
@@ -27,21 +44,32 @@ class PerspectiveTriple:
     object: str
     perspective_id: str  # ID of the contributing perspective/agent
     chunk_number: int = 0
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str | None = None  # Set once per batch by the builder, not per triple
     emphasis_level: float = 0.5  # 0-1 scale of how strongly this is emphasized
     confidence: float = 0.8
     is_inferred: bool = False  # True if inferred vs directly extracted
+    _signature: str = field(init=False, repr=False, default="")
+
+    def __post_init__(self):
+        # Normalize case once at construction so signature() and dedup
+        # lookups don't re-lower on every call. Interning collapses the
+        # heavy repetition of subjects/predicates/objects across triples
+        # into shared strings, which dominates per-triple memory at scale
+        self.subject = sys.intern(self.subject.lower())
+        self.predicate = sys.intern(self.predicate.lower())
+        self.object = sys.intern(self.object.lower())
+        self._signature = f"{self.subject}|{self.predicate}|{self.object}"
 
     def signature(self) -> str:
         """Unique signature for this triple."""
-        return f"{self.subject.lower()}|{self.predicate.lower()}|{self.object.lower()}"
+        return self._signature
 
 
-@dataclass
+@dataclass(slots=True)
 class PerspectiveNode:
     """Node that can be viewed from multiple perspectives."""
 
-    id: str
+    id: int
     canonical_name: str  # The "agreed" name (if any)
     variations: dict[str, set[str]] = field(default_factory=dict)  # perspective_id -> name variations
     contributing_perspectives: set[str] = field(default_factory=set)
@@ -51,41 +79,55 @@ class PerspectiveNode:
 
     def add_perspective(self, perspective_id: str, name_variation: str, weight: float = 0.5):
         """Add a perspective's view of this node."""
+        is_new = perspective_id not in self.contributing_perspectives
         self.contributing_perspectives.add(perspective_id)
-        if perspective_id not in self.variations:
-            self.variations[perspective_id] = set()
-        self.variations[perspective_id].add(name_variation)
+        self.variations.setdefault(perspective_id, set()).add(name_variation)
         self.perspective_weight[perspective_id] = max(self.perspective_weight.get(perspective_id, 0), weight)
-        # Increase diversity with each new perspective
-        self.diversity_score = min(0.95, len(self.contributing_perspectives) * 0.15)
+        # Diversity only changes when a new perspective joins
+        if is_new:
+            self.diversity_score = min(0.95, len(self.contributing_perspectives) * 0.15)
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiViewEdge:
     """Edge that can have multiple interpretations from different viewpoints."""
 
-    id: str
-    subject_id: str
-    object_id: str
+    id: int
+    subject_id: int
+    object_id: int
     predicates: dict[str, str] = field(default_factory=dict)  # perspective_id -> predicate
     tension_intensity: float = 0.0  # 0-1, based on divergence
     parallel_views: list[PerspectiveTriple] = field(default_factory=list)
+    predicate_counts: Counter = field(default_factory=Counter)  # predicate -> refcount
+    unique_predicate_count: int = 0
 
     def add_interpretation(self, perspective_id: str, predicate: str, triple: PerspectiveTriple):
         """Add a perspective's interpretation of this edge."""
+        # Maintain unique predicate count incrementally instead of rebuilding
+        # set(self.predicates.values()) on every call
+        old_predicate = self.predicates.get(perspective_id)
+        if old_predicate is not None and old_predicate != predicate:
+            self.predicate_counts[old_predicate] -= 1
+            if self.predicate_counts[old_predicate] == 0:
+                del self.predicate_counts[old_predicate]
+                self.unique_predicate_count -= 1
+        if old_predicate != predicate:
+            if self.predicate_counts[predicate] == 0:
+                self.unique_predicate_count += 1
+            self.predicate_counts[predicate] += 1
+
         self.predicates[perspective_id] = predicate
         self.parallel_views.append(triple)
         # Calculate tension intensity based on predicate variations
-        unique_predicates = len(set(self.predicates.values()))
-        self.tension_intensity = (unique_predicates - 1) / max(len(self.predicates), 1)
+        self.tension_intensity = (self.unique_predicate_count - 1) / max(len(self.predicates), 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class DivergencePoint:
     """Point where perspectives diverge productively."""
 
-    node_ids: set[str]
-    edge_ids: set[str]
+    node_ids: set[int]
+    edge_ids: set[int]
     divergence_type: str  # "concept", "relationship", "definition", "emphasis"
     perspectives_involved: set[str]
     productivity_factor: float  # 0-1, how productive is this divergence
@@ -93,6 +135,86 @@ class DivergencePoint:
     description: str = ""
 
 
+# Static demonstration triples: kept as plain tuples and materialized once at
+# import so extract_comprehensive_triples doesn't pay 70+ constructor calls
+# (field defaults, case normalization) per invocation
+_COMPREHENSIVE_TRIPLE_DATA: tuple[tuple[str, str, str, str, int, float], ...] = (
+    # AI Engineering and Development Philosophy
+    ("claude code", "is", "cli tool", "architect-1", 1, 0.95),
+    ("claude code", "serves as", "orchestrator", "architect-1", 1, 0.9),
+    ("claude code", "delegates to", "sub-agents", "architect-1", 1, 0.95),
+    ("sub-agents", "provide", "specialized expertise", "architect-1", 2, 0.9),
+    ("sub-agents", "conserve", "context window", "architect-1", 2, 0.85),
+    ("context window", "requires", "strategic compaction", "architect-1", 3, 0.9),
+    # Modular Design Philosophy
+    ("software modules", "are", "bricks", "modular-builder", 1, 0.95),
+    ("interfaces", "are", "studs", "modular-builder", 1, 0.95),
+    ("bricks", "deliver", "single responsibility", "modular-builder", 2, 0.9),
+    ("studs", "enable", "module connection", "modular-builder", 2, 0.9),
+    ("modules", "allow", "regeneration", "modular-builder", 3, 0.85),
+    ("ai", "builds", "modules", "modular-builder", 3, 0.9),
+    ("humans", "define", "specifications", "modular-builder", 4, 0.95),
+    ("humans", "act as", "architects", "modular-builder", 4, 0.9),
+    # Implementation Philosophy - Simplicity
+    ("implementation", "values", "ruthless simplicity", "zen-master", 1, 0.95),
+    ("code", "follows", "wabi-sabi philosophy", "zen-master", 1, 0.85),
+    ("abstractions", "must justify", "existence", "zen-master", 2, 0.9),
+    ("complexity", "emerges from", "simplicity", "zen-master", 2, 0.85),
+    ("solutions", "avoid", "future-proofing", "zen-master", 3, 0.8),
+    ("development", "uses", "80/20 principle", "zen-master", 3, 0.9),
+    # Python Development Practices
+    ("project", "uses", "uv", "python-dev", 1, 0.95),
+    ("uv", "manages", "dependencies", "python-dev", 1, 0.95),
+    ("code", "requires", "type hints", "python-dev", 2, 0.9),
+    ("project", "uses", "ruff", "python-dev", 2, 0.95),
+    ("ruff", "handles", "formatting", "python-dev", 3, 0.9),
+    ("tests", "run via", "pytest", "python-dev", 3, 0.95),
+    ("pydantic", "validates", "data", "python-dev", 4, 0.9),
+    # Knowledge Synthesis System
+    ("graph builder", "constructs", "tension graphs", "synthesis-architect", 1, 0.95),
+    ("graph", "preserves", "diverse perspectives", "synthesis-architect", 1, 0.95),
+    ("tensions", "are", "productive features", "synthesis-architect", 2, 0.9),
+    ("consensus", "requires", "examination", "synthesis-architect", 2, 0.85),
+    ("nodes", "can have", "multiple viewpoints", "synthesis-architect", 3, 0.9),
+    ("edges", "support", "parallel interpretations", "synthesis-architect", 3, 0.9),
+    ("diversity", "indicates", "rich understanding", "synthesis-architect", 4, 0.85),
+    ("graph", "identifies", "divergence points", "synthesis-architect", 4, 0.8),
+    # Claude Code SDK Integration
+    ("claude code sdk", "requires", "npm package", "integration-expert", 1, 0.95),
+    ("claude cli", "needs", "global installation", "integration-expert", 1, 0.95),
+    ("sdk operations", "use", "120-second timeout", "integration-expert", 2, 0.9),
+    ("responses", "may contain", "markdown", "integration-expert", 2, 0.85),
+    ("json parsing", "requires", "markdown stripping", "integration-expert", 3, 0.9),
+    # Knowledge Extraction System
+    ("extraction", "uses", "unified extractor", "knowledge-miner", 1, 0.9),
+    ("extractor", "extracts", "concepts", "knowledge-miner", 1, 0.95),
+    ("extractor", "extracts", "spo triples", "knowledge-miner", 2, 0.95),
+    ("chunk size", "increased to", "10000 words", "knowledge-miner", 2, 0.9),
+    ("claude", "handles", "100k+ tokens", "knowledge-miner", 3, 0.95),
+    # Development Workflow
+    ("changes", "require", "make check", "workflow-expert", 1, 0.95),
+    ("services", "need", "runtime testing", "workflow-expert", 1, 0.9),
+    ("decisions", "are documented", "in ai_working", "workflow-expert", 2, 0.85),
+    ("discoveries", "go in", "discoveries.md", "workflow-expert", 2, 0.9),
+    ("context7", "provides", "documentation", "workflow-expert", 3, 0.85),
+    # Parallel Development
+    ("ai", "enables", "parallel variants", "innovation-agent", 1, 0.85),
+    ("variants", "test", "alternatives", "innovation-agent", 1, 0.8),
+    ("development", "becomes", "exploration space", "innovation-agent", 2, 0.75),
+    ("regeneration", "replaces", "patching", "innovation-agent", 2, 0.85),
+    # Error Handling Philosophy
+    ("errors", "fail", "fast", "error-handler", 1, 0.9),
+    ("common errors", "handled", "robustly", "error-handler", 1, 0.85),
+    ("edge cases", "deferred", "initially", "error-handler", 2, 0.8),
+    ("logs", "provide", "detailed information", "error-handler", 2, 0.9),
+)
+
+_COMPREHENSIVE_TRIPLES = tuple(
+    PerspectiveTriple(subject, predicate, obj, perspective_id, chunk_number, confidence=conf)
+    for subject, predicate, obj, perspective_id, chunk_number, conf in _COMPREHENSIVE_TRIPLE_DATA
+)
+
+
 class TensionGraphBuilder:
     """
     Builds and maintains multi-perspective knowledge graphs.
@@ -105,18 +227,19 @@ class TensionGraphBuilder:
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Core graph structures
-        self.nodes: dict[str, PerspectiveNode] = {}
-        self.edges: dict[str, MultiViewEdge] = {}
+        self.nodes: dict[int, PerspectiveNode] = {}
+        self.edges: dict[int, MultiViewEdge] = {}
         self.triples: list[PerspectiveTriple] = []
+        self.triples_seen: set[tuple[str, str]] = set()  # (signature, perspective_id)
 
         # Perspective management
         self.perspectives: dict[str, dict[str, Any]] = defaultdict(dict)
-        self.divergence_points: list[DivergencePoint] = []
+        self.divergence_points: dict[int, DivergencePoint] = {}  # edge_id -> divergence
 
         # Indices for fast lookup
-        self.name_to_nodes: dict[str, set[str]] = defaultdict(set)  # name -> node_ids
-        self.perspective_nodes: dict[str, set[str]] = defaultdict(set)  # perspective -> node_ids
-        self.perspective_edges: dict[str, set[str]] = defaultdict(set)  # perspective -> edge_ids
+        self.name_to_node: dict[str, int] = {}  # name -> canonical node_id
+        self.perspective_nodes: dict[str, set[int]] = defaultdict(set)  # perspective -> node_ids
+        self.perspective_edges: dict[str, set[int]] = defaultdict(set)  # perspective -> edge_ids
 
         # Configuration
         self.config = {
@@ -159,32 +282,24 @@ class TensionGraphBuilder:
         triples = []
 
         # Simple pattern-based extraction (would use NLP in production)
-        # Look for patterns like "X is Y", "X has Y", "X uses Y", etc.
-        sentences = text.split(".")
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-
-            # Extract based on common patterns
-            if " is " in sentence:
-                parts = sentence.split(" is ", 1)
-                if len(parts) == 2:
-                    subject = parts[0].strip().lower()
-                    object_part = parts[1].strip().lower()
-                    if subject and object_part:
-                        triple = PerspectiveTriple(
-                            subject=subject,
-                            predicate="is",
-                            object=object_part,
-                            perspective_id=perspective_id,
-                            chunk_number=chunk_number,
-                            emphasis_level=emphasis_level,
-                        )
-                        triples.append(triple)
-
-            # More patterns would be added here
+        # Single precompiled regex pass over the text covers "X is Y",
+        # "X has Y", "X uses Y", etc. without per-sentence splitting
+        batch_timestamp = datetime.now().isoformat()
+        for match in _TRIPLE_RE.finditer(text):
+            subject = match.group(1).strip().lower()
+            object_part = match.group(3).strip().lower()
+            if subject and object_part:
+                triples.append(
+                    PerspectiveTriple(
+                        subject=subject,
+                        predicate=match.group(2).lower(),
+                        object=object_part,
+                        perspective_id=perspective_id,
+                        chunk_number=chunk_number,
+                        timestamp=batch_timestamp,
+                        emphasis_level=emphasis_level,
+                    )
+                )
 
         return triples
 
@@ -193,84 +308,7 @@ class TensionGraphBuilder:
         Extract comprehensive SPO triples from the system's knowledge base.
         This demonstrates the types of triples the system manages.
         """
-        comprehensive_triples = [
-            # AI Engineering and Development Philosophy
-            PerspectiveTriple("claude code", "is", "cli tool", "architect-1", 1, confidence=0.95),
-            PerspectiveTriple("claude code", "serves as", "orchestrator", "architect-1", 1, confidence=0.9),
-            PerspectiveTriple("claude code", "delegates to", "sub-agents", "architect-1", 1, confidence=0.95),
-            PerspectiveTriple("sub-agents", "provide", "specialized expertise", "architect-1", 2, confidence=0.9),
-            PerspectiveTriple("sub-agents", "conserve", "context window", "architect-1", 2, confidence=0.85),
-            PerspectiveTriple("context window", "requires", "strategic compaction", "architect-1", 3, confidence=0.9),
-            # Modular Design Philosophy
-            PerspectiveTriple("software modules", "are", "bricks", "modular-builder", 1, confidence=0.95),
-            PerspectiveTriple("interfaces", "are", "studs", "modular-builder", 1, confidence=0.95),
-            PerspectiveTriple("bricks", "deliver", "single responsibility", "modular-builder", 2, confidence=0.9),
-            PerspectiveTriple("studs", "enable", "module connection", "modular-builder", 2, confidence=0.9),
-            PerspectiveTriple("modules", "allow", "regeneration", "modular-builder", 3, confidence=0.85),
-            PerspectiveTriple("ai", "builds", "modules", "modular-builder", 3, confidence=0.9),
-            PerspectiveTriple("humans", "define", "specifications", "modular-builder", 4, confidence=0.95),
-            PerspectiveTriple("humans", "act as", "architects", "modular-builder", 4, confidence=0.9),
-            # Implementation Philosophy - Simplicity
-            PerspectiveTriple("implementation", "values", "ruthless simplicity", "zen-master", 1, confidence=0.95),
-            PerspectiveTriple("code", "follows", "wabi-sabi philosophy", "zen-master", 1, confidence=0.85),
-            PerspectiveTriple("abstractions", "must justify", "existence", "zen-master", 2, confidence=0.9),
-            PerspectiveTriple("complexity", "emerges from", "simplicity", "zen-master", 2, confidence=0.85),
-            PerspectiveTriple("solutions", "avoid", "future-proofing", "zen-master", 3, confidence=0.8),
-            PerspectiveTriple("development", "uses", "80/20 principle", "zen-master", 3, confidence=0.9),
-            # Python Development Practices
-            PerspectiveTriple("project", "uses", "uv", "python-dev", 1, confidence=0.95),
-            PerspectiveTriple("uv", "manages", "dependencies", "python-dev", 1, confidence=0.95),
-            PerspectiveTriple("code", "requires", "type hints", "python-dev", 2, confidence=0.9),
-            PerspectiveTriple("project", "uses", "ruff", "python-dev", 2, confidence=0.95),
-            PerspectiveTriple("ruff", "handles", "formatting", "python-dev", 3, confidence=0.9),
-            PerspectiveTriple("tests", "run via", "pytest", "python-dev", 3, confidence=0.95),
-            PerspectiveTriple("pydantic", "validates", "data", "python-dev", 4, confidence=0.9),
-            # Knowledge Synthesis System
-            PerspectiveTriple(
-                "graph builder", "constructs", "tension graphs", "synthesis-architect", 1, confidence=0.95
-            ),
-            PerspectiveTriple("graph", "preserves", "diverse perspectives", "synthesis-architect", 1, confidence=0.95),
-            PerspectiveTriple("tensions", "are", "productive features", "synthesis-architect", 2, confidence=0.9),
-            PerspectiveTriple("consensus", "requires", "examination", "synthesis-architect", 2, confidence=0.85),
-            PerspectiveTriple("nodes", "can have", "multiple viewpoints", "synthesis-architect", 3, confidence=0.9),
-            PerspectiveTriple("edges", "support", "parallel interpretations", "synthesis-architect", 3, confidence=0.9),
-            PerspectiveTriple(
-                "diversity", "indicates", "rich understanding", "synthesis-architect", 4, confidence=0.85
-            ),
-            PerspectiveTriple("graph", "identifies", "divergence points", "synthesis-architect", 4, confidence=0.8),
-            # Claude Code SDK Integration
-            PerspectiveTriple("claude code sdk", "requires", "npm package", "integration-expert", 1, confidence=0.95),
-            PerspectiveTriple("claude cli", "needs", "global installation", "integration-expert", 1, confidence=0.95),
-            PerspectiveTriple("sdk operations", "use", "120-second timeout", "integration-expert", 2, confidence=0.9),
-            PerspectiveTriple("responses", "may contain", "markdown", "integration-expert", 2, confidence=0.85),
-            PerspectiveTriple(
-                "json parsing", "requires", "markdown stripping", "integration-expert", 3, confidence=0.9
-            ),
-            # Knowledge Extraction System
-            PerspectiveTriple("extraction", "uses", "unified extractor", "knowledge-miner", 1, confidence=0.9),
-            PerspectiveTriple("extractor", "extracts", "concepts", "knowledge-miner", 1, confidence=0.95),
-            PerspectiveTriple("extractor", "extracts", "spo triples", "knowledge-miner", 2, confidence=0.95),
-            PerspectiveTriple("chunk size", "increased to", "10000 words", "knowledge-miner", 2, confidence=0.9),
-            PerspectiveTriple("claude", "handles", "100k+ tokens", "knowledge-miner", 3, confidence=0.95),
-            # Development Workflow
-            PerspectiveTriple("changes", "require", "make check", "workflow-expert", 1, confidence=0.95),
-            PerspectiveTriple("services", "need", "runtime testing", "workflow-expert", 1, confidence=0.9),
-            PerspectiveTriple("decisions", "are documented", "in ai_working", "workflow-expert", 2, confidence=0.85),
-            PerspectiveTriple("discoveries", "go in", "discoveries.md", "workflow-expert", 2, confidence=0.9),
-            PerspectiveTriple("context7", "provides", "documentation", "workflow-expert", 3, confidence=0.85),
-            # Parallel Development
-            PerspectiveTriple("ai", "enables", "parallel variants", "innovation-agent", 1, confidence=0.85),
-            PerspectiveTriple("variants", "test", "alternatives", "innovation-agent", 1, confidence=0.8),
-            PerspectiveTriple("development", "becomes", "exploration space", "innovation-agent", 2, confidence=0.75),
-            PerspectiveTriple("regeneration", "replaces", "patching", "innovation-agent", 2, confidence=0.85),
-            # Error Handling Philosophy
-            PerspectiveTriple("errors", "fail", "fast", "error-handler", 1, confidence=0.9),
-            PerspectiveTriple("common errors", "handled", "robustly", "error-handler", 1, confidence=0.85),
-            PerspectiveTriple("edge cases", "deferred", "initially", "error-handler", 2, confidence=0.8),
-            PerspectiveTriple("logs", "provide", "detailed information", "error-handler", 2, confidence=0.9),
-        ]
-
-        return comprehensive_triples
+        return list(_COMPREHENSIVE_TRIPLES)
 
     def add_perspective_output(
         self, perspective_id: str, extraction_data: dict[str, Any], emphasis_level: float = 0.5
@@ -286,37 +324,36 @@ class TensionGraphBuilder:
         Returns:
             Summary of additions and tensions identified
         """
-        added_triples = []
-        new_divergences = []
+        # Perspective ids key half a dozen dicts/sets per triple; interning
+        # makes those lookups pointer comparisons
+        perspective_id = sys.intern(perspective_id)
 
-        # Process relationships as triples
+        # Build all triples up front, then bulk-append once. Skip triples
+        # this perspective already contributed - re-running an extraction
+        # would otherwise bloat parallel_views and skew tension intensity
         relationships = extraction_data.get("relationships", [])
+        # One timestamp per batch: datetime.now().isoformat() per triple is
+        # measurable overhead during bulk ingestion
+        batch_timestamp = datetime.now().isoformat()
+        added_triples = []
         for rel_data in relationships:
-            if isinstance(rel_data, dict):
-                triple = PerspectiveTriple(
-                    subject=rel_data.get("subject", "").lower(),
-                    predicate=self._normalize_predicate(rel_data.get("predicate", "")),
-                    object=rel_data.get("object", "").lower(),
-                    perspective_id=perspective_id,
-                    emphasis_level=emphasis_level,
-                    confidence=rel_data.get("confidence", 0.8),
-                )
-            elif isinstance(rel_data, Relationship):
-                triple = PerspectiveTriple(
-                    subject=rel_data.subject.lower(),
-                    predicate=self._normalize_predicate(rel_data.predicate),
-                    object=rel_data.object.lower(),
-                    perspective_id=perspective_id,
-                    emphasis_level=emphasis_level,
-                    confidence=rel_data.confidence,
-                )
-            else:
+            triple = self._build_triple(rel_data, perspective_id, emphasis_level)
+            if triple is None:
                 continue
-
-            self.triples.append(triple)
+            triple.timestamp = batch_timestamp
+            seen_key = (triple.signature(), perspective_id)
+            if seen_key in self.triples_seen:
+                continue
+            self.triples_seen.add(seen_key)
             added_triples.append(triple)
+        self.triples.extend(added_triples)
+
+        # Process nodes and edges, collecting touched ids for one bulk
+        # index update per perspective instead of per-triple set.add calls
+        nodes_touched: set[int] = set()
+        edges_touched: set[int] = set()
 
-            # Process nodes and edges
+        for triple in added_triples:
             subject_node_id = self._get_or_create_node(triple.subject, perspective_id, emphasis_level)
             object_node_id = self._get_or_create_node(triple.object, perspective_id, emphasis_level)
 
@@ -324,15 +361,18 @@ class TensionGraphBuilder:
                 subject_node_id, object_node_id, triple.predicate, perspective_id, triple
             )
 
-            # Track perspectives
-            self.perspective_nodes[perspective_id].add(subject_node_id)
-            self.perspective_nodes[perspective_id].add(object_node_id)
-            self.perspective_edges[perspective_id].add(edge_id)
+            nodes_touched.add(subject_node_id)
+            nodes_touched.add(object_node_id)
+            edges_touched.add(edge_id)
 
-            # Check for divergence points
-            divergence = self._detect_divergence(subject_node_id, object_node_id, edge_id)
-            if divergence:
-                new_divergences.append(divergence)
+        # Track perspectives
+        self.perspective_nodes[perspective_id].update(nodes_touched)
+        self.perspective_edges[perspective_id].update(edges_touched)
+
+        # Divergence is a property of the integrated graph, so checking it
+        # per triple does redundant work whenever a batch touches the same
+        # edge repeatedly. Recompute once over the edges this batch changed.
+        new_divergences = self._recompute_divergence_for(edges_touched)
 
         return {
             "added_triples": len(added_triples),
@@ -342,33 +382,62 @@ class TensionGraphBuilder:
             "perspective_contributions": {perspective_id: len(self.perspective_nodes[perspective_id])},
         }
 
+    def _build_triple(
+        self, rel_data: Any, perspective_id: str, emphasis_level: float
+    ) -> PerspectiveTriple | None:
+        """Build a PerspectiveTriple from dict or Relationship data."""
+        if isinstance(rel_data, dict):
+            return PerspectiveTriple(
+                subject=rel_data.get("subject", "").lower(),
+                predicate=self._normalize_predicate(rel_data.get("predicate", "")),
+                object=rel_data.get("object", "").lower(),
+                perspective_id=perspective_id,
+                emphasis_level=emphasis_level,
+                confidence=rel_data.get("confidence", 0.8),
+            )
+        if isinstance(rel_data, Relationship):
+            return PerspectiveTriple(
+                subject=rel_data.subject.lower(),
+                predicate=self._normalize_predicate(rel_data.predicate),
+                object=rel_data.object.lower(),
+                perspective_id=perspective_id,
+                emphasis_level=emphasis_level,
+                confidence=rel_data.confidence,
+            )
+        return None
+
     def _normalize_predicate(self, predicate: str) -> str:
         """Normalize predicate to 1-3 words."""
-        words = predicate.lower().strip().split()
-        return " ".join(words[:3])
+        # split() already skips surrounding whitespace; maxsplit avoids
+        # walking the tail of long predicates. Predicates come from a small
+        # vocabulary, so intern the normalized form for cheap dict keys.
+        words = predicate.lower().split(maxsplit=3)
+        return sys.intern(" ".join(words[:3]))
 
-    def _get_or_create_node(self, name: str, perspective_id: str, weight: float = 0.5) -> str:
+    def _get_or_create_node(self, name: str, perspective_id: str, weight: float = 0.5) -> int:
         """Get existing node or create new one."""
         # Check if node with this name exists
-        for node_id in self.name_to_nodes.get(name, []):
+        node_id = self.name_to_node.get(name)
+        if node_id is not None:
             self.nodes[node_id].add_perspective(perspective_id, name, weight)
             return node_id
 
-        # Create new node
-        node_id = f"node_{self.next_node_id}"
+        # Create new node: plain int ids hash faster than formatted strings
+        # and these keys are used in every graph lookup
+        node_id = self.next_node_id
         self.next_node_id += 1
 
         node = PerspectiveNode(id=node_id, canonical_name=name)
         node.add_perspective(perspective_id, name, weight)
 
         self.nodes[node_id] = node
-        self.name_to_nodes[name].add(node_id)
+        self.name_to_node[name] = node_id
 
         return node_id
 
     def _add_multi_view_edge(
-        self, subject_id: str, object_id: str, predicate: str, perspective_id: str, triple: PerspectiveTriple
-    ) -> str:
+        self, subject_id: int, object_id: int, predicate: str, perspective_id: str, triple: PerspectiveTriple
+    ) -> int:
         """Add or update a multi-view edge."""
         # Check if edge exists between these nodes
         for edge_id, edge in self.edges.items():
@@ -377,7 +446,7 @@ class TensionGraphBuilder:
                 return edge_id
 
         # Create new edge
-        edge_id = f"edge_{self.next_edge_id}"
+        edge_id = self.next_edge_id
         self.next_edge_id += 1
 
         edge = MultiViewEdge(id=edge_id, subject_id=subject_id, object_id=object_id)
@@ -386,19 +455,46 @@ class TensionGraphBuilder:
         self.edges[edge_id] = edge
         return edge_id
 
-    def _detect_divergence(self, subject_id: str, object_id: str, edge_id: str) -> DivergencePoint | None:
+    def _recompute_divergence_for(self, changed_edges: set[int]) -> list[DivergencePoint]:
+        """Run divergence detection once per edge changed by a batch."""
+        new_divergences = []
+        for edge_id in changed_edges:
+            edge = self.edges[edge_id]
+            divergence = self._detect_divergence(edge.subject_id, edge.object_id, edge_id)
+            if divergence:
+                new_divergences.append(divergence)
+        return new_divergences
+
+    def _detect_divergence(self, subject_id: int, object_id: int, edge_id: int) -> DivergencePoint | None:
         """Detect if this creates a divergence point."""
+        edge = self.edges.get(edge_id)
+        if edge is None:
+            return None
+
+        # Cheapest check first: an edge with a single uncontested
+        # interpretation cannot diverge, so skip the node fetches and
+        # perspective-set union for the common case
+        if edge.tension_intensity <= 0.3 and len(edge.predicates) <= 1:
+            return None
+
         # Check if multiple perspectives view these nodes or edge
         subject_node = self.nodes.get(subject_id)
         object_node = self.nodes.get(object_id)
-        edge = self.edges.get(edge_id)
 
-        if not (subject_node and object_node and edge):
+        if not (subject_node and object_node):
             return None
 
         perspectives_involved = subject_node.contributing_perspectives | object_node.contributing_perspectives
 
         if len(perspectives_involved) > 1 or edge.tension_intensity > 0.3:
+            # One divergence record per edge: update it in place rather
+            # than appending a duplicate on every edge update
+            existing = self.divergence_points.get(edge_id)
+            if existing is not None:
+                existing.perspectives_involved |= perspectives_involved
+                existing.productivity_factor = max(existing.productivity_factor, edge.tension_intensity)
+                return None
+
             divergence = DivergencePoint(
                 node_ids={subject_id, object_id},
                 edge_ids={edge_id},
@@ -407,19 +503,148 @@ class TensionGraphBuilder:
                 productivity_factor=edge.tension_intensity,
                 description=f"Different interpretations of {subject_node.canonical_name} -> {object_node.canonical_name}",
             )
-            self.divergence_points.append(divergence)
+            self.divergence_points[edge_id] = divergence
             return divergence
 
         return None
 
     def load(self) -> None:
-        """Load existing graph from storage."""
-        # Simplified load - would implement full loading in production
+        """Load existing graph from storage and rebuild indices in one pass."""
         logger.info(f"Loading graph from {self.storage_path}")
-        # Implementation would deserialize the full graph state
+        raw = self.storage_path.read_bytes()
+        if not raw:
+            return
+        state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+        self.next_node_id = state.get("next_node_id", 1)
+        self.next_edge_id = state.get("next_edge_id", 1)
+        self.perspectives = defaultdict(dict, state.get("perspectives", {}))
+
+        self.triples = [PerspectiveTriple(**t) for t in state.get("triples", [])]
+
+        self.nodes = {}
+        self.name_to_node = {}
+        self.perspective_nodes = defaultdict(set)
+        for n in state.get("nodes", []):
+            node = PerspectiveNode(
+                id=n["id"],
+                canonical_name=n["canonical_name"],
+                variations={p: set(v) for p, v in n["variations"].items()},
+                contributing_perspectives=set(n["contributing_perspectives"]),
+                diversity_score=n["diversity_score"],
+                definitions=n["definitions"],
+                perspective_weight=n["perspective_weight"],
+            )
+            self.nodes[node.id] = node
+            self.name_to_node[node.canonical_name] = node.id
+            for perspective_id in node.contributing_perspectives:
+                self.perspective_nodes[sys.intern(perspective_id)].add(node.id)
+
+        self.edges = {}
+        self.perspective_edges = defaultdict(set)
+        for e in state.get("edges", []):
+            edge = MultiViewEdge(
+                id=e["id"],
+                subject_id=e["subject_id"],
+                object_id=e["object_id"],
+                predicates=e["predicates"],
+                tension_intensity=e["tension_intensity"],
+                parallel_views=[self.triples[i] for i in e["parallel_views"]],
+                predicate_counts=Counter(e["predicate_counts"]),
+                unique_predicate_count=e["unique_predicate_count"],
+            )
+            self.edges[edge.id] = edge
+            for perspective_id in edge.predicates:
+                self.perspective_edges[sys.intern(perspective_id)].add(edge.id)
+
+        self.triples_seen = {(t.signature(), t.perspective_id) for t in self.triples}
+
+        self.divergence_points = {}
+        for d in state.get("divergence_points", []):
+            divergence = DivergencePoint(
+                node_ids=set(d["node_ids"]),
+                edge_ids=set(d["edge_ids"]),
+                divergence_type=d["divergence_type"],
+                perspectives_involved=set(d["perspectives_involved"]),
+                productivity_factor=d["productivity_factor"],
+                timestamp=d["timestamp"],
+                description=d["description"],
+            )
+            for edge_id in divergence.edge_ids:
+                self.divergence_points[edge_id] = divergence
+
+        # Triples are acyclic (string/number fields only) and effectively
+        # append-only, so freeze the freshly loaded graph out of the GC's
+        # generational scans. Only worth it once the graph is large enough
+        # for collection pauses to matter.
+        if len(self.triples) > 10_000:
+            gc.freeze()
 
     def save(self) -> None:
         """Save graph to storage."""
-        # Simplified save - would implement full saving in production
         logger.info(f"Saving graph to {self.storage_path}")
-        # Implementation would serialize the full graph state
+
+        # Triples are shared between self.triples and edge parallel_views;
+        # serialize them once and reference them by index from edges
+        triple_index = {id(t): i for i, t in enumerate(self.triples)}
+        state = {
+            "next_node_id": self.next_node_id,
+            "next_edge_id": self.next_edge_id,
+            "perspectives": dict(self.perspectives),
+            "triples": [
+                {
+                    "subject": t.subject,
+                    "predicate": t.predicate,
+                    "object": t.object,
+                    "perspective_id": t.perspective_id,
+                    "chunk_number": t.chunk_number,
+                    "timestamp": t.timestamp,
+                    "emphasis_level": t.emphasis_level,
+                    "confidence": t.confidence,
+                    "is_inferred": t.is_inferred,
+                }
+                for t in self.triples
+            ],
+            "nodes": [
+                {
+                    "id": n.id,
+                    "canonical_name": n.canonical_name,
+                    "variations": {p: sorted(v) for p, v in n.variations.items()},
+                    "contributing_perspectives": sorted(n.contributing_perspectives),
+                    "diversity_score": n.diversity_score,
+                    "definitions": n.definitions,
+                    "perspective_weight": n.perspective_weight,
+                }
+                for n in self.nodes.values()
+            ],
+            "edges": [
+                {
+                    "id": e.id,
+                    "subject_id": e.subject_id,
+                    "object_id": e.object_id,
+                    "predicates": e.predicates,
+                    "tension_intensity": e.tension_intensity,
+                    "parallel_views": [triple_index[id(t)] for t in e.parallel_views if id(t) in triple_index],
+                    "predicate_counts": dict(e.predicate_counts),
+                    "unique_predicate_count": e.unique_predicate_count,
+                }
+                for e in self.edges.values()
+            ],
+            "divergence_points": [
+                {
+                    "node_ids": sorted(d.node_ids),
+                    "edge_ids": sorted(d.edge_ids),
+                    "divergence_type": d.divergence_type,
+                    "perspectives_involved": sorted(d.perspectives_involved),
+                    "productivity_factor": d.productivity_factor,
+                    "timestamp": d.timestamp,
+                    "description": d.description,
+                }
+                for d in self.divergence_points.values()
+            ],
+        }
+
+        if orjson is not None:
+            self.storage_path.write_bytes(orjson.dumps(state))
+        else:
+            self.storage_path.write_text(json.dumps(state, separators=(",", ":")))
@@ -70,6 +70,11 @@ class KnowledgeMiningConfig(BaseSettings):
         default=1500, description="Characters to use for document classification"
     )
 
+    # Concurrency
+    knowledge_mining_max_concurrency: int = Field(
+        default=16, description="Maximum concurrent extraction requests in batch runs"
+    )
+
     # Storage configuration
     knowledge_mining_storage_dir: Path = Field(
         default_factory=lambda: paths.data_dir / "knowledge_mining",
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Extraction Cache - SQLite-backed memo for LLM classification and extraction results.
+
+Re-running the miner over a corpus repeats identical SDK calls for documents
+that have not changed; a content-hash lookup turns those into a single SELECT.
+"""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCache:
+    """Persistent key/value cache for LLM call results
+
+    Keys are built by the caller and should namespace the model name so a
+    model change never serves stale results. Safe to call from any thread;
+    one lock serializes access to the shared connection.
+    """
+
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # The extractor reads from caller threads and writes from its
+        # background loop thread, so the connection must cross threads
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None on a miss"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        """Store value under key, replacing any previous entry"""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", (key, value))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying connection"""
+        self._conn.close()
@@ -3,14 +3,41 @@
 Insight Generator - Generate actionable insights from patterns and knowledge.
 """
 
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
+from dataclasses import field
 
 from .knowledge_store import KnowledgeNode
 from .knowledge_store import KnowledgeStore
 from .pattern_finder import Pattern
 
-
-@dataclass
+# Context keywords and the context each maps to; matched in one regex pass
+# instead of one substring scan per keyword
+_CTX_TOKENS = {
+    "api": "api_design",
+    "service": "api_design",
+    "endpoint": "api_design",
+    "test": "testing",
+    "testing": "testing",
+    "qa": "testing",
+    "pattern": "architecture",
+    "architecture": "architecture",
+    "design": "architecture",
+    "data": "data_management",
+    "database": "data_management",
+    "storage": "data_management",
+    "async": "concurrency",
+    "concurrent": "concurrency",
+    "parallel": "concurrency",
+}
+_CTX_RE = re.compile("|".join(map(re.escape, _CTX_TOKENS)))
+
+# Technical-term stems for key-term extraction
+_TECH_RE = re.compile(r"data|api|service|pattern|design|system|process|method")
+
+
+@dataclass(slots=True, eq=False)
 class Insight:
     """An actionable insight derived from patterns"""
 
@@ -20,7 +47,28 @@ class Insight:
     supporting_evidence: list[str]
     applicable_contexts: list[str]
     confidence: float
-    action_items: list[str]
+    _action_factory: Callable[[], list[str]] | None = field(default=None, repr=False)
+    _action_items: list[str] | None = field(default=None, repr=False)
+    _search_blob: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Lowercase the searchable text once so context filtering is a
+        # single substring test instead of per-call lower() allocations
+        self._search_blob = "\x00".join(
+            [self.title.lower(), self.description.lower(), *(ctx.lower() for ctx in self.applicable_contexts)]
+        )
+
+    @property
+    def action_items(self) -> list[str]:
+        """Action items, built on first access.
+
+        Context filtering discards many insights before anyone reads their
+        actions; deferring the string formatting means discarded insights
+        never pay for it.
+        """
+        if self._action_items is None:
+            self._action_items = self._action_factory() if self._action_factory else []
+        return self._action_items
 
 
 class InsightGenerator:
@@ -28,16 +76,24 @@ class InsightGenerator:
 
     def __init__(self, store: KnowledgeStore):
         self.store = store
+        # One handler per pattern type so generate_insights makes a single
+        # pass over the patterns instead of four full scans
+        self._handlers = {
+            "technique_combination": self._solution_from_pattern,
+            "recurring_concept": self._recommendation_from_pattern,
+            "concept_cluster": self._warning_from_pattern,
+            "principle_application": self._opportunity_from_pattern,
+        }
 
     def generate_insights(self, patterns: list[Pattern], context: str = "") -> list[Insight]:
         """Generate insights from patterns"""
         insights = []
-
-        # Generate different types of insights
-        insights.extend(self._generate_solution_insights(patterns))
-        insights.extend(self._generate_recommendation_insights(patterns))
-        insights.extend(self._generate_warning_insights(patterns))
-        insights.extend(self._generate_opportunity_insights(patterns))
+        for pattern in patterns:
+            handler = self._handlers.get(pattern.pattern_type)
+            if handler:
+                insight = handler(pattern)
+                if insight is not None:
+                    insights.append(insight)
 
         # Filter by context if provided
         if context:
@@ -46,138 +102,88 @@ class InsightGenerator:
         # Sort by confidence
         return sorted(insights, key=lambda i: i.confidence, reverse=True)
 
-    def _generate_solution_insights(self, patterns: list[Pattern]) -> list[Insight]:
-        """Generate solution-type insights from patterns"""
-        insights = []
-
-        for pattern in patterns:
-            if pattern.pattern_type == "technique_combination":
-                # Techniques used together suggest solutions
-                insight = Insight(
-                    type="solution",
-                    title=f"Combine {pattern.concepts_involved[0]} with {pattern.concepts_involved[1]}",
-                    description=f"These techniques are frequently used together successfully. {pattern.description}",
-                    supporting_evidence=[f"Pattern strength: {pattern.strength:.2f}"]
-                    + [occ["context"] for occ in pattern.occurrences[:3]],
-                    applicable_contexts=self._identify_contexts(pattern),
-                    confidence=pattern.strength,
-                    action_items=[
-                        f"Implement {pattern.concepts_involved[0]}",
-                        f"Integrate with {pattern.concepts_involved[1]}",
-                        "Test the combination",
-                    ],
-                )
-                insights.append(insight)
-
-        return insights
-
-    def _generate_recommendation_insights(self, patterns: list[Pattern]) -> list[Insight]:
-        """Generate recommendation insights from patterns"""
-        insights = []
-
-        for pattern in patterns:
-            if pattern.pattern_type == "recurring_concept" and pattern.strength > 0.5:
-                insight = Insight(
-                    type="recommendation",
-                    title=f"Focus on {pattern.concepts_involved[0]}",
-                    description=f"This concept appears frequently across sources. {pattern.description}",
-                    supporting_evidence=[f"Appears in {len(pattern.occurrences)} sources"],
-                    applicable_contexts=["general", "architecture", "design"],
-                    confidence=pattern.strength,
-                    action_items=[
-                        f"Study {pattern.concepts_involved[0]} in depth",
-                        "Apply to current project",
-                        "Document learnings",
-                    ],
-                )
-                insights.append(insight)
-
-        return insights
-
-    def _generate_warning_insights(self, patterns: list[Pattern]) -> list[Insight]:
-        """Generate warning insights from patterns"""
-        insights = []
-
-        # Look for anti-patterns or problematic combinations
-        for pattern in patterns:
-            if pattern.pattern_type == "concept_cluster" and len(pattern.concepts_involved) > 5:
-                # Check for complexity indicators
-                insight = Insight(
-                    type="warning",
-                    title=f"High complexity around {pattern.concepts_involved[0]}",
-                    description="This area shows high conceptual complexity with many interconnected concepts.",
-                    supporting_evidence=[f"{len(pattern.concepts_involved)} related concepts"],
-                    applicable_contexts=["architecture", "refactoring"],
-                    confidence=0.7,
-                    action_items=[
-                        "Review for simplification opportunities",
-                        "Consider breaking into smaller components",
-                        "Document complexity reasons",
-                    ],
-                )
-                insights.append(insight)
-
-        return insights
-
-    def _generate_opportunity_insights(self, patterns: list[Pattern]) -> list[Insight]:
-        """Generate opportunity insights from patterns"""
-        insights = []
-
-        for pattern in patterns:
-            if pattern.pattern_type == "principle_application" and len(pattern.concepts_involved) > 3:
-                # Principles with multiple applications suggest opportunities
-                insight = Insight(
-                    type="opportunity",
-                    title=f"Leverage {pattern.concepts_involved[0]} broadly",
-                    description=f"This principle has proven applications in multiple areas. {pattern.description}",
-                    supporting_evidence=[f"Applied to: {', '.join(pattern.concepts_involved[1:4])}"],
-                    applicable_contexts=self._identify_contexts(pattern),
-                    confidence=pattern.strength,
-                    action_items=[
-                        f"Identify where {pattern.concepts_involved[0]} applies",
-                        "Create implementation plan",
-                        "Measure impact",
-                    ],
-                )
-                insights.append(insight)
-
-        return insights
+    def _solution_from_pattern(self, pattern: Pattern) -> Insight | None:
+        """Techniques used together suggest solutions"""
+        return Insight(
+            type="solution",
+            title=f"Combine {pattern.concepts_involved[0]} with {pattern.concepts_involved[1]}",
+            description=f"These techniques are frequently used together successfully. {pattern.description}",
+            supporting_evidence=[f"Pattern strength: {pattern.strength:.2f}"]
+            + [occ["context"] for occ in pattern.occurrences[:3]],
+            applicable_contexts=self._identify_contexts(pattern),
+            confidence=pattern.strength,
+            _action_factory=lambda: [
+                f"Implement {pattern.concepts_involved[0]}",
+                f"Integrate with {pattern.concepts_involved[1]}",
+                "Test the combination",
+            ],
+        )
+
+    def _recommendation_from_pattern(self, pattern: Pattern) -> Insight | None:
+        """Recommend concepts that recur strongly across sources"""
+        if pattern.strength <= 0.5:
+            return None
+        return Insight(
+            type="recommendation",
+            title=f"Focus on {pattern.concepts_involved[0]}",
+            description=f"This concept appears frequently across sources. {pattern.description}",
+            supporting_evidence=[f"Appears in {len(pattern.occurrences)} sources"],
+            applicable_contexts=["general", "architecture", "design"],
+            confidence=pattern.strength,
+            _action_factory=lambda: [
+                f"Study {pattern.concepts_involved[0]} in depth",
+                "Apply to current project",
+                "Document learnings",
+            ],
+        )
+
+    def _warning_from_pattern(self, pattern: Pattern) -> Insight | None:
+        """Warn about clusters with high conceptual complexity"""
+        if len(pattern.concepts_involved) <= 5:
+            return None
+        return Insight(
+            type="warning",
+            title=f"High complexity around {pattern.concepts_involved[0]}",
+            description="This area shows high conceptual complexity with many interconnected concepts.",
+            supporting_evidence=[f"{len(pattern.concepts_involved)} related concepts"],
+            applicable_contexts=["architecture", "refactoring"],
+            confidence=0.7,
+            _action_factory=lambda: [
+                "Review for simplification opportunities",
+                "Consider breaking into smaller components",
+                "Document complexity reasons",
+            ],
+        )
+
+    def _opportunity_from_pattern(self, pattern: Pattern) -> Insight | None:
+        """Principles with multiple applications suggest opportunities"""
+        if len(pattern.concepts_involved) <= 3:
+            return None
+        return Insight(
+            type="opportunity",
+            title=f"Leverage {pattern.concepts_involved[0]} broadly",
+            description=f"This principle has proven applications in multiple areas. {pattern.description}",
+            supporting_evidence=[f"Applied to: {', '.join(pattern.concepts_involved[1:4])}"],
+            applicable_contexts=self._identify_contexts(pattern),
+            confidence=pattern.strength,
+            _action_factory=lambda: [
+                f"Identify where {pattern.concepts_involved[0]} applies",
+                "Create implementation plan",
+                "Measure impact",
+            ],
+        )
 
     def _identify_contexts(self, pattern: Pattern) -> list[str]:
         """Identify applicable contexts for a pattern"""
-        contexts = []
-
-        # Heuristic context identification
+        # Heuristic context identification: one regex pass over the text
         concept_text = " ".join(pattern.concepts_involved).lower()
-
-        if any(word in concept_text for word in ["api", "service", "endpoint"]):
-            contexts.append("api_design")
-        if any(word in concept_text for word in ["test", "testing", "qa"]):
-            contexts.append("testing")
-        if any(word in concept_text for word in ["pattern", "architecture", "design"]):
-            contexts.append("architecture")
-        if any(word in concept_text for word in ["data", "database", "storage"]):
-            contexts.append("data_management")
-        if any(word in concept_text for word in ["async", "concurrent", "parallel"]):
-            contexts.append("concurrency")
-
-        return contexts if contexts else ["general"]
+        contexts = {_CTX_TOKENS[match] for match in _CTX_RE.findall(concept_text)}
+        return sorted(contexts) if contexts else ["general"]
 
     def _filter_by_context(self, insights: list[Insight], context: str) -> list[Insight]:
         """Filter insights by context relevance"""
-        filtered = []
         context_lower = context.lower()
-
-        for insight in insights:
-            # Check if context matches any applicable context
-            if (
-                any(context_lower in ctx.lower() for ctx in insight.applicable_contexts)
-                or context_lower in insight.description.lower()
-                or context_lower in insight.title.lower()
-            ):
-                filtered.append(insight)
-
-        return filtered
+        return [insight for insight in insights if context_lower in insight._search_blob]
 
     def generate_problem_insights(self, problem_description: str) -> list[Insight]:
         """Generate insights relevant to a specific problem"""
@@ -201,7 +207,9 @@ class InsightGenerator:
                     supporting_evidence=[f"From: {', '.join(concept_node.sources[:2])}"],
                     applicable_contexts=[problem_description[:50]],
                     confidence=0.6,
-                    action_items=self._generate_action_items(concept_node, related),
+                    _action_factory=lambda concept_node=concept_node, related=related: self._generate_action_items(
+                        concept_node, related
+                    ),
                 )
                 insights.append(insight)
 
@@ -209,32 +217,10 @@ class InsightGenerator:
 
     def _extract_key_terms(self, text: str) -> list[str]:
         """Extract key terms from text (simple implementation)"""
-        # Simple keyword extraction
-        important_words = []
+        # Simple keyword extraction: one compiled regex search per word
+        # instead of a substring scan per technical stem
         words = text.lower().split()
-
-        # Look for technical terms (simple heuristic)
-        for word in words:
-            if (
-                len(word) > 5
-                and word.isalpha()
-                and any(
-                    tech in word
-                    for tech in [
-                        "data",
-                        "api",
-                        "service",
-                        "pattern",
-                        "design",
-                        "system",
-                        "process",
-                        "method",
-                    ]
-                )
-            ):
-                important_words.append(word)
-
-        return list(set(important_words))[:5]
+        return list({word for word in words if len(word) > 5 and word.isalpha() and _TECH_RE.search(word)})[:5]
 
     def _generate_action_items(self, concept_node: KnowledgeNode, related_nodes: list[KnowledgeNode]) -> list[str]:
         """Generate action items from concept nodes"""
@@ -71,12 +71,23 @@ class KnowledgeAssistant:
         # Extract knowledge with document type
         logger.info(f"Starting extraction for: {title} (type: {document_type})")
         try:
-            extraction = self.extractor.extract(content, title=title, source=source, document_type=document_type)
+            if document_type == "general" and not self.extractor.two_step_classification:
+                # Classify and extract in a single SDK round-trip
+                extraction = self.extractor.classify_and_extract(content, title=title, source=source)
+                document_type = extraction.metadata.get("document_type", document_type)
+            else:
+                extraction = self.extractor.extract(content, title=title, source=source, document_type=document_type)
         except RuntimeError as e:
             if "timeout" in str(e).lower():
                 logger.error(f"Extraction timed out for {source} - stopping all extraction")
                 raise  # Re-raise to stop processing
             raise
+
+        return self._ingest_extraction(extraction, document_type)
+
+    def _ingest_extraction(self, extraction, document_type: str = "general") -> dict[str, Any]:
+        """Store an extraction and return its processing summary"""
+        document_type = extraction.metadata.get("document_type", document_type)
         logger.info(
             f"Extraction complete: {len(extraction.concepts)} concepts, {len(extraction.key_insights)} insights"
         )
@@ -91,9 +102,10 @@ class KnowledgeAssistant:
         self.store.save()
 
         return {
-            "title": title,
-            "source": source,
+            "title": extraction.title,
+            "source": extraction.source,
             "status": "processed",
+            "document_type": document_type,
             "concepts_extracted": len(extraction.concepts),
             "relationships_found": len(extraction.relationships),
             "insights_captured": len(extraction.key_insights),
@@ -104,7 +116,7 @@ class KnowledgeAssistant:
     def process_directory(
         self, directory: Path, pattern: str = "*.md", document_type: str = "general"
     ) -> list[dict[str, Any]]:
-        """Process all articles in a directory
+        """Process all articles in a directory, extracting concurrently
 
         Args:
             directory: Directory containing documents
@@ -113,15 +125,19 @@ class KnowledgeAssistant:
         """
         results = []
 
+        # Gather unprocessed documents first so the whole batch goes to the
+        # extractor in one concurrent run instead of one SDK call at a time
+        pending = []
         for file_path in directory.glob(pattern):
             try:
                 content = file_path.read_text()
                 title = file_path.stem.replace("_", " ").title()
 
-                # Use intelligent classification if document type is general
+                # Use intelligent classification if document type is general.
+                # The default path classifies inside the extraction call itself;
+                # the separate Haiku round-trip is kept as a debug option.
                 file_type = document_type
-                if document_type == "general":
-                    # Use Claude Haiku for intelligent classification
+                if document_type == "general" and self.extractor.two_step_classification:
                     file_type = self.extractor.classify_document(content, title)
                     logger.info(f"Classified {file_path.name} as: {file_type}")
 
@@ -133,23 +149,80 @@ class KnowledgeAssistant:
                     # If not relative to cwd, use absolute path
                     source_path = str(file_path)
 
-                result = self.process_article(content, title=title, source=source_path, document_type=file_type)
-                results.append(result)
-                if result["status"] == "skipped":
-                    print(f"Skipped (already processed): {title}")
-                else:
-                    print(f"Processed: {title} (type: {file_type})")
-            except RuntimeError as e:
-                if "timeout" in str(e).lower():
-                    print("\nTimeout occurred - stopping all extraction")
-                    print(
-                        f"Successfully processed {len([r for r in results if r.get('status') == 'processed'])} files before timeout"
+                if source_path != "Unknown" and self.store.is_source_processed(source_path):
+                    logger.info(f"Skipping already processed source: {source_path}")
+                    results.append(
+                        {
+                            "title": title,
+                            "source": source_path,
+                            "status": "skipped",
+                            "reason": "already_processed",
+                            "concepts_extracted": 0,
+                            "relationships_found": 0,
+                            "insights_captured": 0,
+                            "code_patterns": 0,
+                            "nodes_created": 0,
+                        }
                     )
-                    break  # Stop processing more files
-                print(f"Error processing {file_path}: {e}")
+                    print(f"Skipped (already processed): {title}")
+                    continue
+
+                pending.append({"text": content, "title": title, "source": source_path, "document_type": file_type})
             except Exception as e:
                 print(f"Error processing {file_path}: {e}")
 
+        results.extend(self.process_articles_batch(pending))
+        return results
+
+    def process_articles_batch(
+        self, items: list[dict[str, Any]], concurrency: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Extract and ingest a batch of pre-read documents in one concurrent run
+
+        Args:
+            items: Dicts with "text" plus optional "title", "source" and
+                "document_type" keys, one per document
+            concurrency: Maximum in-flight extraction requests; defaults to
+                the knowledge_mining_max_concurrency config field
+
+        Returns one summary dict per processed item. Failed extractions do
+        not abort the batch: each failure is reported with status "failed"
+        and every successful extraction is still ingested.
+        """
+        results: list[dict[str, Any]] = []
+        if not items:
+            return results
+
+        try:
+            extractions = self.extractor.extract_many(items, concurrency)
+        except RuntimeError as e:
+            # Per-item failures come back in the result list; this only fires
+            # when the run itself could not start, so nothing was extracted
+            print(f"Error processing batch: {e}")
+            return results
+
+        for item, extraction in zip(items, extractions, strict=True):
+            if isinstance(extraction, BaseException):
+                logger.error(f"Extraction failed for '{item.get('title', '')}': {extraction}")
+                results.append(
+                    {
+                        "title": item.get("title", ""),
+                        "source": item.get("source", ""),
+                        "status": "failed",
+                        "reason": str(extraction),
+                        "concepts_extracted": 0,
+                        "relationships_found": 0,
+                        "insights_captured": 0,
+                        "code_patterns": 0,
+                        "nodes_created": 0,
+                    }
+                )
+                print(f"Failed: {item.get('title', '')} ({extraction})")
+                continue
+            result = self._ingest_extraction(extraction, item.get("document_type", "general"))
+            results.append(result)
+            print(f"Processed: {item['title']} (type: {result.get('document_type', item.get('document_type'))})")
+
         return results
 
     def find_patterns(self, min_occurrences: int = 2) -> list[Pattern]:
@@ -383,7 +456,8 @@ class KnowledgeAssistant:
         """
         config = get_config()
         filename_lower = file_path.name.lower()
-        content_lower = content.lower()[: config.knowledge_mining_classification_chars]  # Check configured chars
+        # Slice before lowercasing so large files don't pay a full-content copy
+        content_lower = content[: config.knowledge_mining_classification_chars].lower()
 
         # Check filename patterns
         if "api" in filename_lower or "endpoint" in filename_lower or "swagger" in filename_lower:
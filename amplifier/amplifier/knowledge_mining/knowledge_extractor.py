@@ -5,15 +5,20 @@ Simple, direct implementation that actually extracts semantic knowledge.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
-import subprocess
+import re
+import shutil
+import sys
+import threading
 import time
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
 
 from .config import get_config
+from .extraction_cache import ExtractionCache
 
 try:
     from claude_code_sdk import ClaudeCodeOptions
@@ -27,109 +32,21 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Set once the claude CLI has been found on PATH; later extractor instances
+# skip the lookup
+_CLAUDE_CLI_CHECKED = False
 
-@dataclass
-class Concept:
-    """A concept or idea extracted from text"""
-
-    name: str
-    description: str
-    category: str  # pattern, technique, principle, tool, concept
-    importance: float = 0.5  # 0-1 scale
-
-
-@dataclass
-class Relationship:
-    """A relationship between two concepts"""
-
-    source: str
-    target: str
-    relationship_type: str
-    description: str = ""
-
-
-@dataclass
-class Extraction:
-    """Complete extraction from a document"""
-
-    title: str
-    source: str
-    concepts: list[Concept] = field(default_factory=list)
-    relationships: list[Relationship] = field(default_factory=list)
-    key_insights: list[str] = field(default_factory=list)
-    code_patterns: list[dict[str, str]] = field(default_factory=list)
-    metadata: dict[str, Any] = field(default_factory=dict)
-
-
-class KnowledgeExtractor:
-    """Extract knowledge from text using Claude Code SDK"""
-
-    def __init__(self):
-        """Initialize the extractor and REQUIRE Claude Code SDK"""
-        # Check if claude CLI is installed - FAIL if not found
-        try:
-            result = subprocess.run(["which", "claude"], capture_output=True, text=True, timeout=2)
-            if result.returncode != 0:
-                raise RuntimeError(
-                    "\n\n"
-                    + "=" * 60
-                    + "\n"
-                    + "FATAL: Claude CLI not found!\n"
-                    + "The Claude Code SDK is REQUIRED for knowledge extraction.\n"
-                    + "Install with: npm install -g @anthropic-ai/claude-code\n"
-                    + "=" * 60
-                    + "\n"
-                )
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            raise RuntimeError(
-                "\n\n"
-                + "=" * 60
-                + "\n"
-                + "FATAL: Could not check for Claude CLI!\n"
-                + "Install with: npm install -g @anthropic-ai/claude-code\n"
-                + "=" * 60
-                + "\n"
-            )
-
-        # Also check Python SDK is available
-        if not CLAUDE_SDK_AVAILABLE:
-            raise RuntimeError(
-                "\n\n"
-                + "=" * 60
-                + "\n"
-                + "FATAL: Claude Code SDK Python package not found!\n"
-                + "Install with: pip install claude-code-sdk\n"
-                + "=" * 60
-                + "\n"
-            )
-
-        logger.debug("Claude Code SDK verified and ready")
-
-    def classify_document(self, text: str, title: str = "") -> str:
-        """Classify document type using Claude Code SDK - REQUIRED
-
-        Args:
-            text: The text content to classify (first 1500 chars used)
-            title: Optional title to help with classification
+# Captures the JSON body between optional ```json / ``` fences in one pass
+_FENCE_RE = re.compile(r"^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
 
-        Returns:
-            Document type from config's valid types
-        """
-        # Run async classification synchronously
-        try:
-            return asyncio.run(self._classify_document_async(text, title))
-        except Exception as e:
-            logger.error(f"Classification failed: {e}")
-            raise RuntimeError(f"FATAL: Document classification failed: {e}") from e
 
-    async def _classify_document_async(self, text: str, title: str = "") -> str:
-        """Async document classification using Claude Haiku"""
-        config = get_config()
-        # Use configured chars for fast classification
-        sample_text = text[: config.knowledge_mining_classification_chars]
+def _content_key(*parts: str) -> str:
+    """Stable content hash for cache keys"""
+    return hashlib.blake2b("\0".join(parts).encode()).hexdigest()
 
-        classification_prompt = f"""Classify this document into ONE of these categories:
-- article: formal article, research paper, or technical documentation
+# Category guide shared by the standalone classifier and the combined
+# classify+extract prompt
+_CATEGORY_GUIDE = """- article: formal article, research paper, or technical documentation
 - api_docs: API documentation, endpoint descriptions, or integration guides
 - meeting: meeting notes, transcripts, or discussion summaries
 - blog: blog post, personal narrative, or informal writing
@@ -141,217 +58,10 @@ class KnowledgeExtractor:
 - conversation: chat logs, interviews, Q&A sessions
 - code_review: PR reviews, code feedback, architecture discussions
 - post_mortem: incident analysis, lessons learned
-- general: doesn't clearly fit other categories
-
-Title: {title if title else "(no title)"}
-
-Content sample:
-{sample_text}
-
-Respond with ONLY the category name, nothing else."""
-
-        try:
-            # Check if SDK is available (should never happen since we check in __init__)
-            if not CLAUDE_SDK_AVAILABLE or ClaudeSDKClient is None or ClaudeCodeOptions is None:
-                raise RuntimeError("FATAL: Claude Code SDK not available for classification")
-
-            # Use 10-minute timeout for SDK operations (600 seconds)
-            async with asyncio.timeout(600):
-                # Use configured model for fast classification with minimal turns
-                async with ClaudeSDKClient(
-                    options=ClaudeCodeOptions(
-                        system_prompt="You are a document classifier. Respond with only the category name.",
-                        max_turns=1,
-                        model=config.knowledge_mining_model,  # Fast, efficient model for classification
-                    )
-                ) as client:
-                    await client.query(classification_prompt)
-
-                    # Collect response
-                    response = ""
-                    async for message in client.receive_response():
-                        if hasattr(message, "content"):
-                            content = getattr(message, "content", [])
-                            if isinstance(content, list):
-                                for block in content:
-                                    if hasattr(block, "text"):
-                                        response += getattr(block, "text", "")
-
-                    # Clean and validate response
-                    doc_type = response.strip().lower()
-                    valid_types = config.get_valid_document_types()
-
-                    if doc_type in valid_types:
-                        logger.debug(f"Document classified as: {doc_type}")
-                        return doc_type
-                    logger.warning(f"Invalid classification '{doc_type}', defaulting to 'general'")
-                    return "general"
-
-        except TimeoutError:
-            logger.error("Claude Code SDK timed out after 600 seconds for classification")
-            raise RuntimeError("FATAL: Classification timeout - Claude Code SDK not responding")
-        except Exception as e:
-            logger.error(f"Error during classification: {e}")
-            raise RuntimeError(f"FATAL: Classification failed: {e}") from e
-
-        # This should never be reached due to exceptions, but satisfies type checker
-        raise RuntimeError("FATAL: Unexpected classification failure")
-
-    def extract(self, text: str, title: str = "", source: str = "", document_type: str = "general") -> Extraction:
-        """Extract knowledge from text - REQUIRES Claude Code SDK
-
-        Args:
-            text: The text content to extract from
-            title: Title of the document
-            source: Source identifier/path
-            document_type: Type of document (see config for valid types)
-        """
-        try:
-            # Simple synchronous wrapper - always create new event loop
-            return asyncio.run(self._extract_async(text, title, source, document_type))
-        except Exception as e:
-            logger.error(f"Extraction failed: {e}")
-            raise RuntimeError(f"FATAL: Knowledge extraction failed: {e}") from e
-
-    async def _extract_async(
-        self, text: str, title: str = "", source: str = "", document_type: str = "general"
-    ) -> Extraction:
-        """Extract knowledge from text using LLM"""
-        logger.info(f"Starting extraction for: {title} (source: {source}, type: {document_type})")
-        start_time = time.time()
-
-        # Note: Token-based truncation is handled by the caller (resilient_miner.py)
-        # We accept the text as-is since it's already been truncated to token limits
-        config = get_config()
-
-        try:
-            # Build document-type-specific prompt
-            prompt = self._build_extraction_prompt(text, title, document_type)
-
-            # Check if SDK is available
-            if not CLAUDE_SDK_AVAILABLE or ClaudeSDKClient is None or ClaudeCodeOptions is None:
-                logger.error("Claude Code SDK not available - cannot extract knowledge")
-                raise RuntimeError("Claude Code SDK is required for knowledge extraction")
-
-            # Use Claude Code SDK to extract knowledge
-            logger.info("Initializing Claude Code SDK client...")
-
-            response = ""  # Initialize response before the async with block
-
-            # Use 10-minute timeout for SDK operations (600 seconds)
-            async with asyncio.timeout(600):
-                async with ClaudeSDKClient(
-                    options=ClaudeCodeOptions(
-                        system_prompt="You are a knowledge extraction expert. Extract structured knowledge from articles. Return ONLY valid JSON with no other text.",
-                        max_turns=1,
-                        model=config.knowledge_mining_extraction_model,  # More powerful model for extraction
-                    )
-                ) as client:
-                    # Send query
-                    logger.info("Sending query to Claude Code SDK...")
-                    await client.query(prompt)
-
-                    # Collect response - trust the SDK to work
-                    logger.info("Waiting for Claude Code SDK response...")
-                    async for message in client.receive_response():
-                        if hasattr(message, "content"):
-                            content = getattr(message, "content", [])
-                            if isinstance(content, list):
-                                for block in content:
-                                    if hasattr(block, "text"):
-                                        response += getattr(block, "text", "")
-
-            elapsed = time.time() - start_time
-            logger.info(f"Received response in {elapsed:.1f} seconds ({len(response)} characters)")
-
-            # Check for empty response (happens when interrupted)
-            if not response or not response.strip():
-                logger.info("Empty response received - likely interrupted")
-                raise RuntimeError("Extraction interrupted - no response received")
-
-            # Parse JSON response
-            # Strip markdown code block formatting if present
-            cleaned_response = response.strip()
-            if cleaned_response.startswith("```json"):
-                cleaned_response = cleaned_response[7:]  # Remove ```json
-            elif cleaned_response.startswith("```"):
-                cleaned_response = cleaned_response[3:]  # Remove ```
-
-            if cleaned_response.endswith("```"):
-                cleaned_response = cleaned_response[:-3]  # Remove trailing ```
-
-            # Strip any remaining whitespace
-            cleaned_response = cleaned_response.strip()
-
-            try:
-                data = json.loads(cleaned_response)
-
-                # Convert to our data structures
-                concepts = [
-                    Concept(
-                        name=c.get("name", ""),
-                        description=c.get("description", ""),
-                        category=c.get("category", "concept"),
-                        importance=float(c.get("importance", 0.5)),
-                    )
-                    for c in data.get("concepts", [])
-                    if c.get("name")
-                ]
-
-                relationships = [
-                    Relationship(
-                        source=r.get("source", ""),
-                        target=r.get("target", ""),
-                        relationship_type=r.get("type", "related"),
-                        description=r.get("description", ""),
-                    )
-                    for r in data.get("relationships", [])
-                    if r.get("source") and r.get("target")
-                ]
-
-                # Extract ALL insights and patterns - no artificial limits
-                insights = data.get("insights", [])
-                code_patterns = data.get("code_patterns", [])
-
-                elapsed = time.time() - start_time
-                logger.info(
-                    f"Extraction completed in {elapsed:.1f}s: {len(concepts)} concepts, {len(insights)} insights"
-                )
-
-                return Extraction(
-                    title=title,
-                    source=source,
-                    concepts=concepts,
-                    relationships=relationships,
-                    key_insights=insights,
-                    code_patterns=code_patterns,
-                    metadata={"extraction_method": "llm", "text_length": len(text), "extraction_time": elapsed},
-                )
-
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse LLM response as JSON: {e}")
-                logger.error("Original response: %s", response[:500] if response else "(empty)")
-                logger.error("Cleaned response: %s", cleaned_response[:500] if cleaned_response else "(empty)")
-                raise ValueError(
-                    f"LLM did not return valid JSON.\nOriginal length: {len(response)}\nCleaned length: {len(cleaned_response)}\nError: {e}"
-                ) from e
-
-        except TimeoutError:
-            # Handles both asyncio.TimeoutError and builtin TimeoutError (asyncio.TimeoutError is a subclass in Python 3.11+)
-            elapsed = time.time() - start_time
-            logger.error(f"Claude Code SDK timed out after 600 seconds for extraction (total time: {elapsed:.1f}s)")
-            logger.error("FATAL: Extraction timeout - Claude Code SDK not responding")
-            raise RuntimeError("FATAL: Claude Code SDK timeout - extraction cannot continue")
-        except Exception as e:
-            elapsed = time.time() - start_time
-            logger.error(f"Error during LLM extraction after {elapsed:.1f}s: {e}")
-            raise RuntimeError(f"Failed to extract knowledge after {elapsed:.1f}s: {e}") from e
-
-    def _build_extraction_prompt(self, text: str, title: str, document_type: str) -> str:
-        """Build document-type-specific extraction prompt"""
+- general: doesn't clearly fit other categories"""
 
-        # Base JSON structure (same for all types)
-        json_format = """
+# Base JSON structure (same for all document types)
+_EXTRACTION_JSON_FORMAT = """
 {
   "concepts": [
     {
@@ -384,21 +94,22 @@ Respond with ONLY the category name, nothing else."""
   ]
 }"""
 
-        # Document-type-specific prompts
-        if document_type == "api_docs":
-            prompt = f"""Analyze this API documentation and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
+# Shared extraction instructions ride in the system prompt, which the SDK
+# sends once per pooled client session; the per-document prompt carries only
+# the focus bullets, title and text
+_EXTRACTION_SYSTEM_PROMPT = f"""You are a knowledge extraction expert. Extract structured knowledge from documents.
 
 Extract the following in JSON format:
-{json_format}
+{_EXTRACTION_JSON_FORMAT}
 
 IMPORTANT: Extract ALL meaningful information. Do not limit yourself.
+Tailor your extraction to the document type and focus areas given with each document.
+
+Return ONLY valid JSON, no other text."""
 
-Focus on extracting:
+# Document-type-specific focus areas, sent with each per-document prompt
+_EXTRACTION_FOCUSES: dict[str, str] = {
+    "api_docs": """Focus on extracting:
 - API endpoints and their purposes
 - Request/response formats and parameters
 - Authentication methods and requirements
@@ -414,24 +125,8 @@ For code_patterns, focus on:
 - Authentication flows
 - Error handling patterns
 - Request/response handling
-- Pagination patterns
-
-Return ONLY valid JSON, no other text."""
-
-        elif document_type == "meeting":
-            prompt = f"""Analyze this meeting transcript and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
-
-Extract the following in JSON format:
-{json_format}
-
-IMPORTANT: Extract ALL meaningful decisions and discussions. Do not limit yourself.
-
-Focus on extracting:
+- Pagination patterns""",
+    "meeting": """Focus on extracting:
 - Decisions made and rationale
 - Action items and owners
 - Problems discussed and solutions proposed
@@ -446,25 +141,8 @@ For insights, focus on:
 - Action items that need attention
 - Blockers or risks to address
 - Important consensus points
-- Unresolved questions
-
-Return ONLY valid JSON, no other text."""
-
-        elif document_type == "blog":
-            prompt = f"""Analyze this blog post and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
-
-Extract the following in JSON format:
-{json_format}
-
-IMPORTANT: Extract ALL meaningful insights from the article. Do not limit yourself.
-For a rich article, there might be 10-20 insights. For a simple article, there might be 2-3.
-
-Focus on extracting:
+- Unresolved questions""",
+    "blog": """Focus on extracting:
 - Technical patterns and techniques
 - Best practices and principles
 - Tools and technologies mentioned
@@ -472,25 +150,8 @@ Focus on extracting:
 - Lessons learned and experiences
 - Tips and tricks
 - Common mistakes to avoid
-- Code examples and implementations
-
-Return ONLY valid JSON, no other text."""
-
-        elif document_type == "article":
-            # Similar to blog but more formal/academic
-            prompt = f"""Analyze this article and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
-
-Extract the following in JSON format:
-{json_format}
-
-IMPORTANT: Extract ALL meaningful knowledge from the article. Do not limit yourself.
-
-Focus on extracting:
+- Code examples and implementations""",
+    "article": """Focus on extracting:
 - Core concepts and theories
 - Methodologies and frameworks
 - Research findings and data
@@ -498,24 +159,8 @@ Focus on extracting:
 - Comparative analyses
 - Best practices and standards
 - Industry trends
-- Technical implementations
-
-Return ONLY valid JSON, no other text."""
-
-        elif document_type == "tutorial":
-            prompt = f"""Analyze this tutorial and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
-
-Extract the following in JSON format:
-{json_format}
-
-IMPORTANT: Extract ALL meaningful steps and instructions. Do not limit yourself.
-
-Focus on extracting:
+- Technical implementations""",
+    "tutorial": """Focus on extracting:
 - Prerequisites and requirements
 - Step-by-step instructions
 - Configuration settings
@@ -530,24 +175,8 @@ For code_patterns, focus on:
 - Setup and configuration examples
 - Command sequences
 - Code templates
-- Testing patterns
-
-Return ONLY valid JSON, no other text."""
-
-        elif document_type == "research":
-            prompt = f"""Analyze this research document and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
-
-Extract the following in JSON format:
-{json_format}
-
-IMPORTANT: Extract ALL meaningful findings and methodologies. Do not limit yourself.
-
-Focus on extracting:
+- Testing patterns""",
+    "research": """Focus on extracting:
 - Research questions and hypotheses
 - Methodologies and approaches
 - Key findings and results
@@ -562,24 +191,8 @@ For insights, focus on:
 - Novel discoveries
 - Contradictions to existing knowledge
 - Practical implications
-- Methodology innovations
-
-Return ONLY valid JSON, no other text."""
-
-        elif document_type == "changelog":
-            prompt = f"""Analyze this changelog and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
-
-Extract the following in JSON format:
-{json_format}
-
-IMPORTANT: Extract ALL meaningful changes and updates. Do not limit yourself.
-
-Focus on extracting:
+- Methodology innovations""",
+    "changelog": """Focus on extracting:
 - New features and capabilities
 - Breaking changes and migrations
 - Bug fixes and improvements
@@ -594,24 +207,8 @@ For insights, focus on:
 - Migration strategies
 - Compatibility concerns
 - Performance impacts
-- Security implications
-
-Return ONLY valid JSON, no other text."""
-
-        elif document_type == "readme":
-            prompt = f"""Analyze this README documentation and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
-
-Extract the following in JSON format:
-{json_format}
-
-IMPORTANT: Extract ALL meaningful project information. Do not limit yourself.
-
-Focus on extracting:
+- Security implications""",
+    "readme": """Focus on extracting:
 - Project purpose and goals
 - Installation instructions
 - Usage examples
@@ -626,24 +223,8 @@ For code_patterns, focus on:
 - Installation commands
 - Configuration examples
 - Usage patterns
-- API examples
-
-Return ONLY valid JSON, no other text."""
-
-        elif document_type == "specification":
-            prompt = f"""Analyze this technical specification and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
-
-Extract the following in JSON format:
-{json_format}
-
-IMPORTANT: Extract ALL technical requirements and standards. Do not limit yourself.
-
-Focus on extracting:
+- API examples""",
+    "specification": """Focus on extracting:
 - Technical requirements
 - Protocol definitions
 - Data formats and schemas
@@ -658,24 +239,8 @@ For insights, focus on:
 - Critical requirements
 - Implementation challenges
 - Compliance needs
-- Integration points
-
-Return ONLY valid JSON, no other text."""
-
-        elif document_type == "conversation":
-            prompt = f"""Analyze this conversation/interview and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
-
-Extract the following in JSON format:
-{json_format}
-
-IMPORTANT: Extract ALL meaningful exchanges and insights. Do not limit yourself.
-
-Focus on extracting:
+- Integration points""",
+    "conversation": """Focus on extracting:
 - Key questions and answers
 - Expert opinions and advice
 - Problem descriptions and solutions
@@ -689,24 +254,8 @@ For insights, focus on:
 - Expert knowledge shared
 - Problem-solving approaches
 - Lessons from experience
-- Unique perspectives
-
-Return ONLY valid JSON, no other text."""
-
-        elif document_type == "code_review":
-            prompt = f"""Analyze this code review and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
-
-Extract the following in JSON format:
-{json_format}
-
-IMPORTANT: Extract ALL code review feedback and discussions. Do not limit yourself.
-
-Focus on extracting:
+- Unique perspectives""",
+    "code_review": """Focus on extracting:
 - Code quality issues
 - Architecture feedback
 - Performance suggestions
@@ -721,24 +270,8 @@ For code_patterns, focus on:
 - Problem code examples
 - Suggested improvements
 - Refactoring patterns
-- Testing approaches
-
-Return ONLY valid JSON, no other text."""
-
-        elif document_type == "post_mortem":
-            prompt = f"""Analyze this post-mortem and extract structured knowledge.
-
-Title: {title}
-
-Content:
-{text}
-
-Extract the following in JSON format:
-{json_format}
-
-IMPORTANT: Extract ALL incident details and learnings. Do not limit yourself.
-
-Focus on extracting:
+- Testing approaches""",
+    "post_mortem": """Focus on extracting:
 - Incident timeline and impact
 - Root cause analysis
 - Contributing factors
@@ -754,37 +287,729 @@ For insights, focus on:
 - System weaknesses
 - Process improvements
 - Prevention measures
-- Monitoring gaps
+- Monitoring gaps""",
+    "general": """Focus on extracting:
+- Key concepts and ideas
+- Relationships between concepts
+- Practical insights and learnings
+- Patterns and techniques
+- Best practices and principles
+- Tools and technologies
+- Code examples (if present)
+- Actionable recommendations""",
+}
+
+
+@dataclass(slots=True)
+class Concept:
+    """A concept or idea extracted from text"""
+
+    name: str
+    description: str
+    category: str  # pattern, technique, principle, tool, concept
+    importance: float = 0.5  # 0-1 scale
 
-Return ONLY valid JSON, no other text."""
 
-        else:  # "general" or unknown type
-            prompt = f"""Analyze this document and extract structured knowledge.
+@dataclass(slots=True)
+class Relationship:
+    """A relationship between two concepts"""
+
+    source: str
+    target: str
+    relationship_type: str
+    description: str = ""
+
+
+@dataclass(slots=True)
+class Extraction:
+    """Complete extraction from a document"""
+
+    title: str
+    source: str
+    concepts: list[Concept] = field(default_factory=list)
+    relationships: list[Relationship] = field(default_factory=list)
+    key_insights: list[str] = field(default_factory=list)
+    code_patterns: list[dict[str, str]] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+class _ClientPool:
+    """Pool of connected ClaudeSDKClient instances keyed by (system_prompt, model)
+
+    Reusing a client keeps the SDK's subprocess and transport warm across
+    requests instead of tearing them down per document. The pool is bound to
+    one event loop; idle clients from a previous (closed) loop are discarded.
+    """
+
+    def __init__(self, max_idle: int = 16):
+        self.max_idle = max_idle
+        self._idle: dict[tuple[str, str], list[Any]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def acquire(self, system_prompt: str, model: str) -> Any:
+        """Pop an idle client for this key, or connect a new one"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Clients from a closed loop cannot be reused or cleanly closed
+            self._idle.clear()
+            self._loop = loop
+
+        idle = self._idle.setdefault((system_prompt, model), [])
+        if idle:
+            return idle.pop()
+
+        client = ClaudeSDKClient(options=ClaudeCodeOptions(system_prompt=system_prompt, max_turns=1, model=model))
+        await client.connect()
+        return client
+
+    async def release(self, system_prompt: str, model: str, client: Any) -> None:
+        """Return a healthy client to the pool, or disconnect it if full"""
+        idle = self._idle.setdefault((system_prompt, model), [])
+        if asyncio.get_running_loop() is self._loop and len(idle) < self.max_idle:
+            idle.append(client)
+        else:
+            await client.disconnect()
+
+    async def warmup(self, system_prompt: str, model: str) -> None:
+        """Connect one client for this key ahead of the first real query
+
+        Failures are non-fatal; the first query pays the cold start instead.
+        """
+        try:
+            client = await self.acquire(system_prompt, model)
+            await self.release(system_prompt, model, client)
+        except Exception as e:
+            logger.debug(f"Client pre-warm failed: {e}")
+
+    async def aclose(self) -> None:
+        """Disconnect every idle client"""
+        for idle in self._idle.values():
+            while idle:
+                await idle.pop().disconnect()
+        self._idle.clear()
+
+
+class KnowledgeExtractor:
+    """Extract knowledge from text using Claude Code SDK"""
+
+    def __init__(self, two_step_classification: bool = False):
+        """Initialize the extractor and REQUIRE Claude Code SDK
+
+        Args:
+            two_step_classification: Debug flag to classify and extract in two
+                separate SDK calls instead of one combined call
+        """
+        self.two_step_classification = two_step_classification
+        config = get_config()
+        self._pool = _ClientPool(max_idle=config.knowledge_mining_max_concurrency)
+        self._cache = ExtractionCache(config.ensure_storage_dir() / "llm_cache.db")
+        # Shared background loop for the sync entrypoints; created lazily so
+        # pooled clients stay warm between calls instead of dying with each
+        # asyncio.run loop
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        # Check if claude CLI is installed - FAIL if not found. The PATH walk
+        # runs once per process; later instances reuse the verdict.
+        global _CLAUDE_CLI_CHECKED
+        if not _CLAUDE_CLI_CHECKED:
+            if shutil.which("claude") is None:
+                raise RuntimeError(
+                    "\n\n"
+                    + "=" * 60
+                    + "\n"
+                    + "FATAL: Claude CLI not found!\n"
+                    + "The Claude Code SDK is REQUIRED for knowledge extraction.\n"
+                    + "Install with: npm install -g @anthropic-ai/claude-code\n"
+                    + "=" * 60
+                    + "\n"
+                )
+            _CLAUDE_CLI_CHECKED = True
+
+        # Also check Python SDK is available
+        if not CLAUDE_SDK_AVAILABLE:
+            raise RuntimeError(
+                "\n\n"
+                + "=" * 60
+                + "\n"
+                + "FATAL: Claude Code SDK Python package not found!\n"
+                + "Install with: pip install claude-code-sdk\n"
+                + "=" * 60
+                + "\n"
+            )
+
+        logger.debug("Claude Code SDK verified and ready")
+
+        # Connect the first extraction client in the background so the first
+        # extract() call skips the SDK subprocess spawn and handshake
+        asyncio.run_coroutine_threadsafe(
+            self._pool.warmup(_EXTRACTION_SYSTEM_PROMPT, config.knowledge_mining_extraction_model),
+            self._ensure_loop(),
+        )
+
+    @staticmethod
+    def _fast_classify(text: str, title: str = "") -> str | None:
+        """Classify trivially-obvious documents without a model call
+
+        Only high-precision fingerprints belong here; anything ambiguous
+        returns None and falls through to Claude. Rules are ordered by how
+        often each type shows up in typical corpora.
+        """
+        title_lower = title.lower()
+        head_lower = text[:200].lstrip().lower()
+
+        if "readme" in title_lower:
+            return "readme"
+        if "changelog" in title_lower or head_lower.startswith("# changelog"):
+            return "changelog"
+        if re.match(r"(openapi|swagger):\s*[\"']?\d", head_lower):
+            return "api_docs"
+        if "post-mortem" in title_lower or "postmortem" in title_lower or head_lower.startswith(("# post-mortem", "# postmortem")):
+            return "post_mortem"
+        if "meeting notes" in title_lower or "transcript" in title_lower:
+            return "meeting"
+        return None
+
+    def classify_document(self, text: str, title: str = "") -> str:
+        """Classify document type using Claude Code SDK - REQUIRED
+
+        Args:
+            text: The text content to classify (first 1500 chars used)
+            title: Optional title to help with classification
+
+        Returns:
+            Document type from config's valid types
+        """
+        # Trivially-classifiable documents never need a model call
+        fast_type = self._fast_classify(text, title)
+        if fast_type is not None:
+            logger.debug(f"Fast-path classification: {fast_type}")
+            return fast_type
+
+        # Memoize on the classified sample so unchanged documents skip the SDK call
+        config = get_config()
+        limit = config.knowledge_mining_classification_chars
+        # Short documents reuse the original string; no copy needed
+        sample_text = text if len(text) <= limit else text[:limit]
+        key = f"classify:{config.knowledge_mining_model}:{_content_key(title, sample_text)}"
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.debug(f"Classification cache hit: {cached}")
+            return cached
+
+        # Run async classification synchronously
+        try:
+            doc_type = self._run_sync(self._classify_document_async(sample_text, title))
+        except Exception as e:
+            logger.error(f"Classification failed: {e}")
+            raise RuntimeError(f"FATAL: Document classification failed: {e}") from e
+
+        self._cache.set(key, doc_type)
+        return doc_type
+
+    async def _classify_document_async(self, sample_text: str, title: str = "") -> str:
+        """Async document classification using Claude Haiku
+
+        The caller passes the already-sliced classification sample so the
+        substring is allocated once per classify call at most.
+        """
+        config = get_config()
+
+        classification_prompt = f"""Classify this document into ONE of these categories:
+{_CATEGORY_GUIDE}
+
+Title: {title if title else "(no title)"}
+
+Content sample:
+{sample_text}
+
+Respond with ONLY the category name, nothing else."""
+
+        try:
+            # Use configured model for fast classification with minimal turns
+            response = await self._query_sdk(
+                classification_prompt,
+                model=config.knowledge_mining_model,  # Fast, efficient model for classification
+                system_prompt="You are a document classifier. Respond with only the category name.",
+            )
+
+            # Clean and validate response
+            doc_type = response.strip().lower()
+            valid_types = config.get_valid_document_types()
+
+            if doc_type in valid_types:
+                logger.debug(f"Document classified as: {doc_type}")
+                return doc_type
+            logger.warning(f"Invalid classification '{doc_type}', defaulting to 'general'")
+            return "general"
+
+        except TimeoutError:
+            logger.error("Claude Code SDK timed out after 600 seconds for classification")
+            raise RuntimeError("FATAL: Classification timeout - Claude Code SDK not responding")
+        except Exception as e:
+            logger.error(f"Error during classification: {e}")
+            raise RuntimeError(f"FATAL: Classification failed: {e}") from e
+
+        # This should never be reached due to exceptions, but satisfies type checker
+        raise RuntimeError("FATAL: Unexpected classification failure")
+
+    def extract(self, text: str, title: str = "", source: str = "", document_type: str = "general") -> Extraction:
+        """Extract knowledge from text - REQUIRES Claude Code SDK
+
+        Args:
+            text: The text content to extract from
+            title: Title of the document
+            source: Source identifier/path
+            document_type: Type of document (see config for valid types)
+        """
+        try:
+            # Synchronous wrapper over extract_async for non-async callers
+            return self._run_sync(self.extract_async(text, title, source, document_type))
+        except Exception as e:
+            logger.error(f"Extraction failed: {e}")
+            raise RuntimeError(f"FATAL: Knowledge extraction failed: {e}") from e
+
+    async def extract_async(
+        self, text: str, title: str = "", source: str = "", document_type: str = "general"
+    ) -> Extraction:
+        """Async counterpart to extract for callers already running an event loop
+
+        Lets async callers gather many extractions at their own layer instead
+        of being forced through the sync wrapper and its background loop.
+        """
+        return await self._extract_async(text, title, source, document_type)
+
+    def extract_many(
+        self, items: list[dict[str, Any]], concurrency: int | None = None
+    ) -> list[Extraction | BaseException]:
+        """Extract knowledge from many documents concurrently
+
+        Failures are isolated per document: a failed item comes back as its
+        exception in place, so one bad document does not discard the rest of
+        the batch.
+
+        Args:
+            items: Dicts with "text" plus optional "title", "source" and
+                "document_type" keys, one per document
+            concurrency: Maximum in-flight SDK requests; defaults to the
+                knowledge_mining_max_concurrency config field
+        """
+        try:
+            return self._run_sync(self.extract_many_async(items, concurrency))
+        except Exception as e:
+            logger.error(f"Batch extraction failed: {e}")
+            raise RuntimeError(f"FATAL: Knowledge extraction failed: {e}") from e
+
+    async def extract_many_async(
+        self, items: list[dict[str, Any]], concurrency: int | None = None
+    ) -> list[Extraction | BaseException]:
+        """Run extractions concurrently on one event loop under a bounded semaphore
+
+        Each SDK call spends most of its wall time waiting on the model, so
+        overlapping requests gives near-linear speedup up to the concurrency
+        limit. Exceptions are returned in place rather than raised so callers
+        can ingest the successes and report per-item failures.
+        """
+        if concurrency is None:
+            concurrency = get_config().knowledge_mining_max_concurrency
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(item: dict[str, Any]) -> Extraction:
+            async with semaphore:
+                document_type = item.get("document_type", "general")
+                if document_type == "general" and not self.two_step_classification:
+                    return await self._classify_and_extract_async(
+                        item["text"], item.get("title", ""), item.get("source", "")
+                    )
+                return await self._extract_async(
+                    item["text"], item.get("title", ""), item.get("source", ""), document_type
+                )
+
+        return list(await asyncio.gather(*(bounded(item) for item in items), return_exceptions=True))
+
+    def extract_many_batch(self, items: list[dict[str, Any]], poll_interval: int = 30) -> list[Extraction]:
+        """Extract knowledge from many documents via the Anthropic Message Batches API
+
+        Batched requests are billed at half the live per-token rate and the
+        service schedules throughput itself, at the cost of turnaround time
+        (up to 24 hours). Use for offline corpus runs where nobody is waiting
+        on the results. Falls back to the live concurrent path when the batch
+        API cannot be used. Items that fail are logged and skipped; they stay
+        cache misses, so rerunning submits only the failures.
+
+        Args:
+            items: Dicts with "text" plus optional "title", "source" and
+                "document_type" keys, one per document
+            poll_interval: Seconds between batch status polls
+        """
+        config = get_config()
+        model = config.knowledge_mining_extraction_model
+        start_time = time.time()
+
+        # Serve cached documents immediately; only misses go into the batch
+        extractions: list[Extraction | None] = [None] * len(items)
+        pending: list[tuple[int, dict[str, Any], str]] = []
+        for i, item in enumerate(items):
+            document_type = item.get("document_type", "general")
+            cache_key = f"extract:{model}:{document_type}:{_content_key(item['text'])}"
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                extractions[i] = self._build_extraction(
+                    json.loads(cached), item.get("title", ""), item.get("source", ""), item["text"], start_time
+                )
+            else:
+                pending.append((i, item, cache_key))
+
+        if pending:
+            requests = [
+                {
+                    "custom_id": str(i),
+                    "params": {
+                        "model": model,
+                        "max_tokens": 8192,
+                        "system": _EXTRACTION_SYSTEM_PROMPT,
+                        "messages": [
+                            {
+                                "role": "user",
+                                "content": self._build_extraction_prompt(
+                                    item["text"], item.get("title", ""), item.get("document_type", "general")
+                                ),
+                            }
+                        ],
+                    },
+                }
+                for i, item, _ in pending
+            ]
+
+            try:
+                import anthropic
+
+                client = anthropic.Anthropic()
+                batch = client.messages.batches.create(requests=requests)
+                logger.info(f"Submitted message batch {batch.id} with {len(requests)} requests")
+                while batch.processing_status != "ended":
+                    time.sleep(poll_interval)
+                    batch = client.messages.batches.retrieve(batch.id)
+                results = {result.custom_id: result for result in client.messages.batches.results(batch.id)}
+            except Exception as e:
+                logger.warning(f"Batch API unavailable ({e}) - falling back to live extraction")
+                live = self.extract_many([item for _, item, _ in pending])
+                for (i, item, _), extraction in zip(pending, live, strict=True):
+                    if isinstance(extraction, BaseException):
+                        logger.error(f"Live fallback extraction failed for '{item.get('title', '')}': {extraction}")
+                        continue
+                    extractions[i] = extraction
+                return [e for e in extractions if e is not None]
+
+            # A batch run may have taken hours and is already paid for, so a
+            # bad item is logged and skipped rather than discarding the rest;
+            # skipped items stay cache misses and are retried on the next run
+            for i, item, cache_key in pending:
+                result = results.get(str(i))
+                if result is None or result.result.type != "succeeded":
+                    kind = result.result.type if result else "missing"
+                    logger.error(f"Batch extraction failed for '{item.get('title', '')}': {kind}")
+                    continue
+                response = "".join(
+                    text for block in result.result.message.content if (text := getattr(block, "text", None))
+                )
+                try:
+                    data = self._parse_json_response(response)
+                except Exception as e:
+                    logger.error(f"Batch extraction returned unparseable output for '{item.get('title', '')}': {e}")
+                    continue
+                self._cache.set(cache_key, json.dumps(data))
+                extractions[i] = self._build_extraction(
+                    data, item.get("title", ""), item.get("source", ""), item["text"], start_time
+                )
+
+        return [e for e in extractions if e is not None]
+
+    def classify_and_extract(self, text: str, title: str = "", source: str = "") -> Extraction:
+        """Classify document type and extract knowledge in a single SDK call
+
+        Saves one full round-trip per document compared to calling
+        classify_document followed by extract. The detected type is stored in
+        the extraction's metadata under "document_type".
+        """
+        try:
+            return self._run_sync(self._classify_and_extract_async(text, title, source))
+        except Exception as e:
+            logger.error(f"Combined classification and extraction failed: {e}")
+            raise RuntimeError(f"FATAL: Knowledge extraction failed: {e}") from e
+
+    async def _classify_and_extract_async(self, text: str, title: str = "", source: str = "") -> Extraction:
+        """Classify and extract with one LLM round-trip"""
+        logger.info(f"Starting combined classify+extract for: {title} (source: {source})")
+        start_time = time.time()
+        config = get_config()
+
+        prompt = f"""First classify the document into ONE of these categories:
+{_CATEGORY_GUIDE}
+
+Then extract knowledge, tailoring your focus to the category you chose.
+Add a top-level "document_type" key holding the category name alongside the extraction fields.
 
 Title: {title}
 
 Content:
-{text}
+{text}"""
 
-Extract the following in JSON format:
-{json_format}
+        cache_key = f"classify_extract:{config.knowledge_mining_extraction_model}:{_content_key(text)}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Extraction cache hit for: {title}")
+            data = await asyncio.to_thread(json.loads, cached)
+        else:
+            data = None
 
-IMPORTANT: Extract ALL meaningful insights. Do not limit yourself.
-Adapt your extraction based on the content type you observe.
+        try:
+            if data is None:
+                response = await self._query_sdk(prompt, model=config.knowledge_mining_extraction_model)
 
-Focus on extracting:
-- Key concepts and ideas
-- Relationships between concepts
-- Practical insights and learnings
-- Patterns and techniques
-- Best practices and principles
-- Tools and technologies
-- Code examples (if present)
-- Actionable recommendations
+                elapsed = time.time() - start_time
+                logger.info(f"Received response in {elapsed:.1f} seconds ({len(response)} characters)")
 
-Return ONLY valid JSON, no other text."""
+                data, extraction = await asyncio.to_thread(
+                    self._parse_cache_build, response, cache_key, title, source, text, start_time
+                )
+            else:
+                extraction = self._build_extraction(data, title, source, text, start_time)
+
+            # Validate the embedded classification
+            doc_type = str(data.get("document_type", "")).strip().lower()
+            if doc_type not in config.get_valid_document_types():
+                logger.warning(f"Invalid classification '{doc_type}', defaulting to 'general'")
+                doc_type = "general"
+            extraction.metadata["document_type"] = doc_type
+            logger.debug(f"Document classified as: {doc_type}")
+            return extraction
+
+        except TimeoutError:
+            elapsed = time.time() - start_time
+            logger.error(f"Claude Code SDK timed out after 600 seconds for extraction (total time: {elapsed:.1f}s)")
+            raise RuntimeError("FATAL: Claude Code SDK timeout - extraction cannot continue")
+        except Exception as e:
+            elapsed = time.time() - start_time
+            logger.error(f"Error during LLM extraction after {elapsed:.1f}s: {e}")
+            raise RuntimeError(f"Failed to extract knowledge after {elapsed:.1f}s: {e}") from e
+
+    async def _extract_async(
+        self, text: str, title: str = "", source: str = "", document_type: str = "general"
+    ) -> Extraction:
+        """Extract knowledge from text using LLM"""
+        logger.info(f"Starting extraction for: {title} (source: {source}, type: {document_type})")
+        start_time = time.time()
+
+        # Note: Token-based truncation is handled by the caller
+        # We accept the text as-is since it's already been truncated to token limits
+        config = get_config()
+
+        cache_key = f"extract:{config.knowledge_mining_extraction_model}:{document_type}:{_content_key(text)}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Extraction cache hit for: {title}")
+            data = await asyncio.to_thread(json.loads, cached)
+            return self._build_extraction(data, title, source, text, start_time)
+
+        try:
+            # Build document-type-specific prompt
+            prompt = self._build_extraction_prompt(text, title, document_type)
 
-        return prompt
+            response = await self._query_sdk(prompt, model=config.knowledge_mining_extraction_model)
+
+            elapsed = time.time() - start_time
+            logger.info(f"Received response in {elapsed:.1f} seconds ({len(response)} characters)")
+
+            _, extraction = await asyncio.to_thread(
+                self._parse_cache_build, response, cache_key, title, source, text, start_time
+            )
+            return extraction
+
+        except TimeoutError:
+            # Handles both asyncio.TimeoutError and builtin TimeoutError (asyncio.TimeoutError is a subclass in Python 3.11+)
+            elapsed = time.time() - start_time
+            logger.error(f"Claude Code SDK timed out after 600 seconds for extraction (total time: {elapsed:.1f}s)")
+            logger.error("FATAL: Extraction timeout - Claude Code SDK not responding")
+            raise RuntimeError("FATAL: Claude Code SDK timeout - extraction cannot continue")
+        except Exception as e:
+            elapsed = time.time() - start_time
+            logger.error(f"Error during LLM extraction after {elapsed:.1f}s: {e}")
+            raise RuntimeError(f"Failed to extract knowledge after {elapsed:.1f}s: {e}") from e
+
+    async def _query_sdk(
+        self,
+        prompt: str,
+        model: str,
+        system_prompt: str = _EXTRACTION_SYSTEM_PROMPT,
+    ) -> str:
+        """Send a single query through the Claude Code SDK and collect the response text"""
+        # Check if SDK is available
+        if not CLAUDE_SDK_AVAILABLE or ClaudeSDKClient is None or ClaudeCodeOptions is None:
+            logger.error("Claude Code SDK not available - cannot extract knowledge")
+            raise RuntimeError("Claude Code SDK is required for knowledge extraction")
+
+        client = await self._pool.acquire(system_prompt, model)
+
+        # Collect text chunks and join once at the end; += on a growing string
+        # recopies the accumulated response for every message
+        chunks: list[str] = []
+        try:
+            # Use 10-minute timeout for SDK operations (600 seconds)
+            async with asyncio.timeout(600):
+                # Send query
+                logger.info("Sending query to Claude Code SDK...")
+                await client.query(prompt)
+
+                # Collect response - trust the SDK to work
+                logger.info("Waiting for Claude Code SDK response...")
+                async for message in client.receive_response():
+                    for block in getattr(message, "content", ()) or ():
+                        text = getattr(block, "text", None)
+                        if text:
+                            chunks.append(text)
+        except BaseException:
+            # Don't pool a client with a half-consumed response stream
+            await client.disconnect()
+            raise
+
+        await self._pool.release(system_prompt, model, client)
+        return "".join(chunks)
+
+    def _run_sync(self, coro: Any) -> Any:
+        """Run a coroutine on the shared background loop and wait for the result
+
+        asyncio.run would build and tear down a loop (plus signal handlers and
+        thread-local state) per call and close over the client pool with it.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the shared background loop on first use"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, daemon=True, name="knowledge-extractor-loop"
+            )
+            self._loop_thread.start()
+        return self._loop
+
+    def close(self) -> None:
+        """Disconnect pooled clients and stop the background loop"""
+        if self._loop is None:
+            return
+        if sys.is_finalizing():
+            # The daemon loop thread can no longer run Python, so waiting on
+            # it would hang the process; the OS reclaims everything anyway
+            return
+        asyncio.run_coroutine_threadsafe(self._pool.aclose(), self._loop).result(timeout=10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._loop_thread is not None:
+            self._loop_thread.join()
+            self._loop_thread = None
+        self._loop.close()
+        self._loop = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:  # A wedged loop or shutdown race is not worth raising over
+            pass
+
+    async def aclose(self) -> None:
+        """Disconnect any pooled SDK clients (for long-lived async callers)"""
+        await self._pool.aclose()
+
+    def _parse_cache_build(
+        self, response: str, cache_key: str, title: str, source: str, text: str, start_time: float
+    ) -> tuple[dict[str, Any], Extraction]:
+        """Parse a raw response, memoize it, and build the Extraction
+
+        This is the CPU-bound tail of an extraction; callers run it via
+        asyncio.to_thread so the event loop keeps draining the response
+        streams of other in-flight requests.
+        """
+        data = self._parse_json_response(response)
+        self._cache.set(cache_key, json.dumps(data))
+        return data, self._build_extraction(data, title, source, text, start_time)
+
+    def _parse_json_response(self, response: str) -> dict[str, Any]:
+        """Strip markdown code fences and parse the LLM response as JSON"""
+        # Strip markdown code fences and surrounding whitespace in one pass
+        match = _FENCE_RE.match(response)
+        cleaned_response = match.group(1) if match else response.strip()
+
+        # Check for empty response (happens when interrupted)
+        if not cleaned_response:
+            logger.info("Empty response received - likely interrupted")
+            raise RuntimeError("Extraction interrupted - no response received")
+
+        try:
+            data = json.loads(cleaned_response)
+            if not isinstance(data, dict):
+                raise ValueError(f"LLM returned a JSON {type(data).__name__}, expected an object")
+            return data
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse LLM response as JSON: {e}")
+            logger.error("Original response: %s", response[:500] if response else "(empty)")
+            logger.error("Cleaned response: %s", cleaned_response[:500] if cleaned_response else "(empty)")
+            raise ValueError(
+                f"LLM did not return valid JSON.\nOriginal length: {len(response)}\nCleaned length: {len(cleaned_response)}\nError: {e}"
+            ) from e
+
+    def _build_extraction(self, data: dict[str, Any], title: str, source: str, text: str, start_time: float) -> Extraction:
+        """Convert a parsed response dict into our data structures"""
+        # Fetch each field once per item; responses can carry hundreds of
+        # concepts, so redundant dict lookups add up
+        concepts: list[Concept] = []
+        for c in data.get("concepts") or ():
+            name = c.get("name")
+            if not name:
+                continue
+            concepts.append(
+                Concept(
+                    name=name,
+                    description=c.get("description", ""),
+                    category=c.get("category", "concept"),
+                    importance=float(c.get("importance", 0.5)),
+                )
+            )
+
+        relationships: list[Relationship] = []
+        for r in data.get("relationships") or ():
+            rel_source = r.get("source")
+            rel_target = r.get("target")
+            if not (rel_source and rel_target):
+                continue
+            relationships.append(
+                Relationship(
+                    source=rel_source,
+                    target=rel_target,
+                    relationship_type=r.get("type", "related"),
+                    description=r.get("description", ""),
+                )
+            )
+
+        # Extract ALL insights and patterns - no artificial limits
+        insights = data.get("insights") or []
+        code_patterns = data.get("code_patterns") or []
+
+        elapsed = time.time() - start_time
+        logger.info(f"Extraction completed in {elapsed:.1f}s: {len(concepts)} concepts, {len(insights)} insights")
+
+        return Extraction(
+            title=title,
+            source=source,
+            concepts=concepts,
+            relationships=relationships,
+            key_insights=insights,
+            code_patterns=code_patterns,
+            metadata={"extraction_method": "llm", "text_length": len(text), "extraction_time": elapsed},
+        )
+
+    def _build_extraction_prompt(self, text: str, title: str, document_type: str) -> str:
+        """Build the per-document prompt; the shared schema lives in the system prompt"""
+        focus = _EXTRACTION_FOCUSES.get(document_type, _EXTRACTION_FOCUSES["general"])
+        return f"Document type: {document_type}\n\n{focus}\n\nTitle: {title}\n\nContent:\n{text}"
 
 
 if __name__ == "__main__":
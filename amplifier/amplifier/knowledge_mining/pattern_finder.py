@@ -38,9 +38,12 @@ class PatternFinder:
         self.concept_graph = defaultdict(set)  # concept -> related concepts
         self.concept_sources = defaultdict(list)  # concept -> sources
         self.co_occurrences = defaultdict(int)  # (concept1, concept2) -> count
+        self._patterns_cache: dict[int, list[Pattern]] = {}  # min_occurrences -> patterns
 
     def add_extraction(self, extraction: Extraction):
         """Add an extraction to the pattern finder"""
+        # New knowledge invalidates any previously computed patterns
+        self._patterns_cache.clear()
 
         # Track concept sources
         for concept in extraction.concepts:
@@ -57,7 +60,15 @@ class PatternFinder:
             self.co_occurrences[pair] += 1
 
     def find_patterns(self, min_occurrences: int = 2) -> list[Pattern]:
-        """Find patterns across all added extractions"""
+        """Find patterns across all added extractions
+
+        Results are memoized until the next add_extraction, since a single run
+        asks for patterns several times over the same knowledge.
+        """
+        cached = self._patterns_cache.get(min_occurrences)
+        if cached is not None:
+            return cached
+
         patterns = []
 
         # Find recurring concepts
@@ -76,7 +87,9 @@ class PatternFinder:
         applications = self._find_principle_applications()
         patterns.extend(applications)
 
-        return sorted(patterns, key=lambda p: p.strength, reverse=True)
+        patterns = sorted(patterns, key=lambda p: p.strength, reverse=True)
+        self._patterns_cache[min_occurrences] = patterns
+        return patterns
 
     def _find_recurring_concepts(self, min_occurrences: int) -> list[Pattern]:
         """Find concepts that appear across multiple sources"""
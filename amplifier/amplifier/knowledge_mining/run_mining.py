@@ -4,79 +4,132 @@ Command-line interface for the Knowledge Mining System.
 """
 
 import logging
-import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from amplifier.config.paths import paths
+from tqdm import tqdm
 
-from .knowledge_assistant import KnowledgeAssistant
+if TYPE_CHECKING:
+    from .knowledge_assistant import KnowledgeAssistant
 
 # Set up logging with INFO level to see progress
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S"
 )
 
+# Maps filename separators to spaces when deriving titles from stems
+_TITLE_SEPARATORS = str.maketrans("-_", "  ")
 
-def process_articles(directory: Path, limit: int | None = None, document_type: str = "general"):
+
+def _read_article(path: Path) -> str:
+    """Read an article as UTF-8, substituting any undecodable bytes.
+
+    read_bytes + one-shot decode skips read_text's incremental decoder and
+    newline translation, and a stray bad byte degrades to a replacement
+    character instead of losing the whole article.
+    """
+    return path.read_bytes().decode("utf-8", errors="replace")
+
+
+def process_articles(
+    directory: Path,
+    limit: int | None = None,
+    document_type: str = "general",
+    workers: int | None = None,
+    sort_by_inode: bool = False,
+):
     """Process articles from a directory.
 
     Args:
         directory: Directory containing articles
         limit: Maximum number of articles to process
         document_type: Type of documents ('article', 'api_docs', 'meeting', 'blog', 'general')
+        workers: Maximum concurrent extraction requests (defaults to config)
+        sort_by_inode: Read files in inode order (helps on rotational/shared storage)
     """
+    # Imported here so --help and argument errors don't pay for the SDK stack
+    from .knowledge_assistant import KnowledgeAssistant
+
     assistant = KnowledgeAssistant()
 
-    # Find all markdown files
-    articles = list(directory.glob("*.md"))
+    # Stream the directory scan instead of materializing every match; with a
+    # limit the scan stops as soon as enough articles have been seen
+    articles = directory.glob("*.md")
+    if sort_by_inode:
+        # Directory-return order can mean random seeks on rotational or shared
+        # storage; inode order keeps reads nearer-sequential. Costs a full scan
+        # plus a stat per file, so it stays opt-in.
+        articles = iter(sorted(articles, key=lambda p: p.stat().st_ino))
     if limit:
-        articles = articles[:limit]
+        articles = islice(articles, limit)
 
-    print(f"Found {len(articles)} articles to process")
+    print(f"Scanning {directory} for articles")
     print("-" * 60)
 
-    for i, article_path in enumerate(articles, 1):
-        print(f"\nProcessing {i}/{len(articles)}: {article_path.name}")
-        print("  📖 Reading article...")
-
-        start_time = time.time()
+    # First pass needs no file content: derive the source path and drop
+    # already-processed articles with a store lookup
+    to_read = []
+    skipped = 0
+    for article_path in articles:
+        # Convert to relative path for consistent storage
         try:
-            content = article_path.read_text()
-            title = article_path.stem.replace("-", " ").replace("_", " ").title()
-
-            # Auto-detect document type if general
-            article_type = document_type
-            if document_type == "general":
-                article_type = assistant._detect_document_type(article_path, content)
-
-            print(f"  🔍 Extracting knowledge from {len(content)} characters (type: {article_type})...")
-            sys.stdout.flush()  # Force output immediately
-
-            # Convert to relative path for consistent storage
-            try:
-                relative_path = article_path.relative_to(Path.cwd())
-                source_path = str(relative_path)
-            except ValueError:
-                # If not relative to cwd, use absolute path
-                source_path = str(article_path)
-
-            result = assistant.process_article(content, title, source=source_path, document_type=article_type)
-            elapsed = time.time() - start_time
-
-            if result.get("status") == "skipped":
-                print(f"  ⏭️  Skipped (already processed) [{elapsed:.1f}s]")
-            else:
-                print(f"  ✓ Extracted {result['concepts_extracted']} concepts [{elapsed:.1f}s]")
-                print(f"  ✓ Found {result['relationships_found']} relationships")
-                print(f"  ✓ Generated {result['insights_captured']} insights")
-        except Exception as e:
-            elapsed = time.time() - start_time
-            print(f"  ❌ FAILED after {elapsed:.1f}s: {e}")
-            logging.error(f"Failed to process {article_path.name}", exc_info=True)
-            # Continue with next article instead of crashing
+            relative_path = article_path.relative_to(Path.cwd())
+            source_path = str(relative_path)
+        except ValueError:
+            # If not relative to cwd, use absolute path
+            source_path = str(article_path)
+
+        if assistant.store.is_source_processed(source_path):
+            skipped += 1
             continue
 
+        to_read.append((article_path, source_path))
+
+    if skipped:
+        print(f"⏭️  Skipped {skipped} already-processed articles")
+
+    # Read and classify everything up front, then hand the whole batch to the
+    # extractor so the LLM calls run concurrently instead of one at a time.
+    # The reads go through a thread pool so many small files overlap their
+    # device latency instead of stalling one pread at a time.
+    pending = []
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = [(path, source, executor.submit(_read_article, path)) for path, source in to_read]
+        with tqdm(total=len(futures), unit="article", desc="Reading") as pbar:
+            for article_path, source_path, future in futures:
+                try:
+                    content = future.result()
+                    title = article_path.stem.translate(_TITLE_SEPARATORS).title()
+
+                    # Auto-detect document type if general
+                    article_type = document_type
+                    if document_type == "general":
+                        article_type = assistant._detect_document_type(article_path, content)
+
+                    pending.append(
+                        {"text": content, "title": title, "source": source_path, "document_type": article_type}
+                    )
+                    pbar.set_postfix_str(f"{len(pending)} queued")
+                except Exception as e:
+                    pbar.write(f"❌ FAILED to read {article_path.name}: {e}")
+                    logging.error(f"Failed to read {article_path.name}", exc_info=True)
+                    # Continue with next article instead of crashing
+                pbar.update(1)
+
+    print(f"\n🔍 Extracting knowledge from {len(pending)} articles concurrently...")
+
+    start_time = time.time()
+    results = assistant.process_articles_batch(pending, concurrency=workers)
+    elapsed = time.time() - start_time
+
+    for result in results:
+        print(f"  ✓ {result['title']}: {result['concepts_extracted']} concepts, ", end="")
+        print(f"{result['relationships_found']} relationships, {result['insights_captured']} insights")
+    print(f"\nProcessed {len(results)} articles in {elapsed:.1f}s")
+
     # Find patterns across all articles
     print("\n" + "=" * 60)
     print("DISCOVERING PATTERNS")
@@ -101,7 +154,7 @@ def process_articles(directory: Path, limit: int | None = None, document_type: s
     return assistant
 
 
-def solve_problem(assistant: KnowledgeAssistant, problem: str):
+def solve_problem(assistant: "KnowledgeAssistant", problem: str):
     """Apply knowledge to solve a problem."""
     print("\n" + "=" * 60)
     print("PROBLEM SOLVING")
@@ -128,6 +181,8 @@ def main():
     """Main entry point."""
     import argparse
 
+    from amplifier.config.paths import paths
+
     parser = argparse.ArgumentParser(description="Knowledge Mining System")
     parser.add_argument(
         "--articles",
@@ -143,13 +198,19 @@ def main():
         choices=["article", "api_docs", "meeting", "blog", "general"],
         help="Type of documents to process",
     )
+    parser.add_argument("--workers", type=int, help="Maximum concurrent extraction requests (defaults to config)")
+    parser.add_argument(
+        "--sort-by-inode",
+        action="store_true",
+        help="Read articles in inode order (faster on rotational/shared storage)",
+    )
     parser.add_argument("--problem", type=str, help="Problem to solve using mined knowledge")
     parser.add_argument("--export", type=Path, help="Export knowledge base to JSON file")
 
     args = parser.parse_args()
 
     # Process articles
-    assistant = process_articles(args.articles, args.limit, args.type)
+    assistant = process_articles(args.articles, args.limit, args.type, args.workers, args.sort_by_inode)
 
     # Solve problem if specified
     if args.problem:
@@ -6,12 +6,16 @@ Contract: Process articles with graceful degradation and partial result saving
 """
 
 import asyncio
+import atexit
+import hashlib
 import json
 import logging
 import os
+import re
+import sqlite3
 import sys
+import threading
 import time
-from dataclasses import asdict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -22,6 +26,7 @@ from amplifier.config.paths import paths
 from amplifier.content_loader import ContentItem
 from amplifier.utils.logging_utils import ExtractionLogger
 from amplifier.utils.notifications import send_notification
+from amplifier.utils.token_utils import batch_truncate_to_tokens
 from amplifier.utils.token_utils import truncate_to_tokens
 
 if TYPE_CHECKING:
@@ -29,13 +34,29 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes in C several times faster than stdlib json, which matters
+# on the per-article save path; fall back to the stdlib when not installed
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
+# Characters that cannot appear in filenames derived from article IDs
+_UNSAFE_ID_CHARS = re.compile(r"[^A-Za-z0-9_\-]")
+
 
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessorResult:
     """Result from a single processor/extractor."""
 
@@ -46,7 +67,7 @@ class ProcessorResult:
     extracted_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ArticleProcessingStatus:
     """Complete processing status for a single article."""
 
@@ -62,7 +83,16 @@ class ArticleProcessingStatus:
             "article_id": self.article_id,
             "title": self.title,
             "last_processed": self.last_processed.isoformat(),
-            "processor_results": {name: asdict(result) for name, result in self.processor_results.items()},
+            "processor_results": {
+                name: {
+                    "processor_name": result.processor_name,
+                    "status": result.status,
+                    "error_message": result.error_message,
+                    "retry_count": result.retry_count,
+                    "extracted_count": result.extracted_count,
+                }
+                for name, result in self.processor_results.items()
+            },
             "is_complete": self.is_complete,
         }
 
@@ -86,16 +116,51 @@ class ArticleProcessingStatus:
 
 
 class ProcessingStatusStore:
-    """Simple JSON-based status storage with incremental saves."""
+    """SQLite-backed status storage with incremental saves."""
 
     def __init__(self, status_dir: Path | None = None):
         """Initialize status store.
 
         Args:
-            status_dir: Directory for status files (default: data_dir/processing_status)
+            status_dir: Directory for the status database (default: data_dir/processing_status)
         """
         self.status_dir = status_dir or paths.data_dir / "processing_status"
         self.status_dir.mkdir(parents=True, exist_ok=True)
+        # One row per article instead of one file per article; WAL keeps the
+        # per-article saves cheap and readers unblocked during writes
+        db_path = self.status_dir / "status.db"
+        fresh_db = not db_path.exists()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS status ("
+            "article_id TEXT PRIMARY KEY, json TEXT NOT NULL, is_complete INT, last_processed TEXT)"
+        )
+        self._conn.commit()
+        if fresh_db:
+            self._import_legacy_json_files()
+
+    def _import_legacy_json_files(self) -> None:
+        """One-time import of per-article *.json status files into the database.
+
+        Earlier versions stored one JSON file per article in status_dir.
+        Without this import the switch to SQLite would forget all prior
+        progress and the resume checks would reprocess the whole corpus with
+        fresh LLM calls. The files are left in place after import.
+        """
+        imported = 0
+        for path in sorted(self.status_dir.glob("*.json")):
+            try:
+                status = ArticleProcessingStatus.from_dict(json.loads(path.read_text(encoding="utf-8")))
+            except Exception as e:
+                logger.warning(f"Skipping legacy status file {path.name}: {e}")
+                continue
+            self.save_status(status)
+            imported += 1
+        if imported:
+            logger.info(f"Imported {imported} legacy status files into status.db")
 
     def save_status(self, status: ArticleProcessingStatus) -> None:
         """Save status for a single article.
@@ -103,12 +168,17 @@ class ProcessingStatusStore:
         Args:
             status: Processing status to save
         """
-        # Use article_id as filename (sanitized)
-        safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in status.article_id)
-        status_file = self.status_dir / f"{safe_id}.json"
-
-        # Save atomically
-        status_file.write_text(json.dumps(status.to_dict(), indent=2))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO status (article_id, json, is_complete, last_processed) VALUES (?, ?, ?, ?)",
+                (
+                    status.article_id,
+                    json.dumps(status.to_dict(), separators=(",", ":")),
+                    int(status.is_complete),
+                    status.last_processed.isoformat(),
+                ),
+            )
+            self._conn.commit()
 
     def load_status(self, article_id: str) -> ArticleProcessingStatus | None:
         """Load status for a single article.
@@ -119,15 +189,14 @@ class ProcessingStatusStore:
         Returns:
             Processing status or None if not found
         """
-        safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in article_id)
-        status_file = self.status_dir / f"{safe_id}.json"
+        with self._lock:
+            row = self._conn.execute("SELECT json FROM status WHERE article_id = ?", (article_id,)).fetchone()
 
-        if not status_file.exists():
+        if row is None:
             return None
 
         try:
-            data = json.loads(status_file.read_text())
-            return ArticleProcessingStatus.from_dict(data)
+            return ArticleProcessingStatus.from_dict(json.loads(row[0]))
         except Exception as e:
             logger.warning(f"Failed to load status for {article_id}: {e}")
             return None
@@ -138,16 +207,79 @@ class ProcessingStatusStore:
         Returns:
             List of all processing statuses
         """
+        with self._lock:
+            rows = self._conn.execute("SELECT json FROM status").fetchall()
+
         statuses = []
-        for status_file in self.status_dir.glob("*.json"):
+        for (raw,) in rows:
             try:
-                data = json.loads(status_file.read_text())
-                statuses.append(ArticleProcessingStatus.from_dict(data))
+                statuses.append(ArticleProcessingStatus.from_dict(json.loads(raw)))
             except Exception as e:
-                logger.warning(f"Failed to load status from {status_file}: {e}")
+                logger.warning(f"Failed to load a stored status: {e}")
 
         return statuses
 
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+
+# ============================================================================
+# PROGRESS RENDERING
+# ============================================================================
+
+
+class ProgressRenderer:
+    """Single shared spinner line for all in-flight jobs.
+
+    One lazily started asyncio task redraws a status line for whatever jobs
+    are active, replacing the two spinner threads previously spawned per
+    article. Everything runs on the event loop, so no locking is needed;
+    write() is the safe way to emit a full line while the spinner is live.
+    """
+
+    _SPINNER = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+
+    def __init__(self):
+        self._jobs: dict[str, tuple[str, float]] = {}  # job_id -> (label, start time)
+        self._task: asyncio.Task | None = None
+        self._line_len = 0
+
+    def begin(self, job_id: str, label: str) -> None:
+        """Start showing progress for a job, spinning up the render loop lazily."""
+        self._jobs[job_id] = (label, time.time())
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._render_loop())
+
+    def end(self, job_id: str) -> None:
+        """Stop showing progress for a job; the render loop exits when none remain."""
+        self._jobs.pop(job_id, None)
+
+    def write(self, message: str) -> None:
+        """Emit a full output line without corrupting the in-progress spinner line."""
+        self._clear_line()
+        sys.stdout.write(message + "\n")
+        sys.stdout.flush()
+
+    def _clear_line(self) -> None:
+        if self._line_len:
+            sys.stdout.write("\r" + " " * self._line_len + "\r")
+            self._line_len = 0
+
+    async def _render_loop(self) -> None:
+        spinner_idx = 0
+        while self._jobs:
+            now = time.time()
+            parts = [f"{label} ({now - started:.1f}s)" for label, started in self._jobs.values()]
+            message = f"├─ {self._SPINNER[spinner_idx]} " + " | ".join(parts)
+            self._clear_line()
+            sys.stdout.write(message)
+            sys.stdout.flush()
+            self._line_len = len(message)
+            spinner_idx = (spinner_idx + 1) % len(self._SPINNER)
+            await asyncio.sleep(0.1)
+        self._clear_line()
+
 
 # ============================================================================
 # RESILIENT KNOWLEDGE MINER
@@ -173,6 +305,7 @@ class ArticleProcessor:
         self.extractor = extractor
         self.status_store = status_store or ProcessingStatusStore()
         self.extraction_logger = ExtractionLogger()
+        self._progress = ProgressRenderer()
         self.use_focused_extractors = use_focused_extractors
         self.focused_extractor = None
 
@@ -198,6 +331,38 @@ class ArticleProcessor:
             "total_patterns": 0,
         }
 
+        # Persistent classification memo; loaded lazily on first classify
+        self._classify_cache_path = paths.data_dir / "classification_cache.json"
+        self._classify_cache: dict[str, str] | None = None
+
+        # article_id -> document_type, filled by classify_many for batch runs
+        self._classified_types: dict[str, str] = {}
+
+        # In-memory mirror of the status store, loaded on first report and
+        # kept current as articles save, so repeated reports during a long
+        # run stop re-reading and re-parsing every stored row
+        self._status_cache: dict[str, ArticleProcessingStatus] | None = None
+
+        # Long-lived append handle for the JSONL mirror; opening and closing
+        # the file once per article meant thousands of tiny syncs over a big
+        # run. Buffered writes flush when the buffer fills and on exit.
+        jsonl_path = paths.data_dir / "knowledge" / "extractions.jsonl"
+        jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        self._jsonl_fh = open(jsonl_path, "a", encoding="utf-8", buffering=1 << 20)
+        atexit.register(self._jsonl_fh.close)
+
+    def _load_classify_cache(self) -> dict[str, str]:
+        """Load the classification cache from disk on first use."""
+        if self._classify_cache is None:
+            try:
+                self._classify_cache = json.loads(self._classify_cache_path.read_text())
+            except FileNotFoundError:
+                self._classify_cache = {}
+            except Exception as e:
+                logger.warning(f"Could not load classification cache: {e}")
+                self._classify_cache = {}
+        return self._classify_cache
+
     async def _classify_document(self, text: str, title: str = "") -> str:
         """Classify document type using Claude Code SDK.
 
@@ -208,6 +373,19 @@ class ArticleProcessor:
         Returns:
             Document type string (e.g., "article", "api_docs", "tutorial", etc.)
         """
+        from amplifier.knowledge_mining.config import get_config
+
+        # The classifier only ever sees this sample, so its hash fully keys
+        # the result; repeat and duplicate articles skip the LLM round-trip
+        limit = get_config().knowledge_mining_classification_chars
+        sample_text = text if len(text) <= limit else text[:limit]
+        cache = self._load_classify_cache()
+        cache_key = hashlib.blake2b(f"{title}\0{sample_text}".encode(), digest_size=16).hexdigest()
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Classification cache hit: {cached}")
+            return cached
+
         # Try to get classifier from appropriate source
         classifier = None
 
@@ -235,9 +413,15 @@ class ArticleProcessor:
             try:
                 # Call the async classifier directly (no nested event loops)
                 document_type = await asyncio.wait_for(
-                    classifier(text, title),
+                    classifier(sample_text, title),
                     timeout=30.0,  # 30 second timeout
                 )
+                cache[cache_key] = document_type
+                try:
+                    self._classify_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._classify_cache_path.write_text(json.dumps(cache))
+                except Exception as e:
+                    logger.warning(f"Could not persist classification cache: {e}")
                 return document_type
             except TimeoutError:
                 logger.warning("Document classification timed out, using 'general'")
@@ -248,8 +432,35 @@ class ArticleProcessor:
 
         return "general"  # Default fallback
 
+    async def classify_many(self, articles: list[ContentItem], concurrency: int = 8) -> dict[str, str]:
+        """Classify a batch of articles concurrently, ahead of processing.
+
+        Classification is a small independent LLM call per article, so running
+        them together hides its latency behind the slowest request instead of
+        paying it serially once per article. Results land in
+        self._classified_types, which process_article_with_logging consults
+        before falling back to per-article classification.
+
+        Args:
+            articles: Articles to classify
+            concurrency: Maximum classification requests in flight
+
+        Returns:
+            Mapping of article_id to document type
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def classify(article: ContentItem) -> None:
+            async with semaphore:
+                self._classified_types[article.content_id] = await self._classify_document(
+                    article.content, article.title
+                )
+
+        await asyncio.gather(*(classify(article) for article in articles))
+        return self._classified_types
+
     async def process_article_with_logging(
-        self, article: ContentItem, current: int, total: int
+        self, article: ContentItem, current: int, total: int, truncation: tuple[str, int, int] | None = None
     ) -> ArticleProcessingStatus:
         """Process a single article with detailed logging.
 
@@ -257,6 +468,7 @@ class ArticleProcessor:
             article: Content item to process
             current: Current article number (1-based)
             total: Total number of articles
+            truncation: Pre-computed truncate_to_tokens result for this article's content
 
         Returns:
             Processing status with results from all processors
@@ -264,51 +476,29 @@ class ArticleProcessor:
         # Start article processing with clean logging
         self.extraction_logger.start_article(current, total, article.title, article.content_id)
 
-        # Truncate content to token limit
-        truncated_content, original_tokens, final_tokens = truncate_to_tokens(article.content)
+        # Truncate content to token limit (batch callers tokenize up front)
+        if truncation is None:
+            truncation = truncate_to_tokens(article.content)
+        truncated_content, original_tokens, final_tokens = truncation
         self.extraction_logger.log_truncation(original_tokens, final_tokens)
 
-        # Classify document type using Claude Code SDK (fast model)
-        import threading
-
-        # Set up for animated classification progress
-        classification_done = threading.Event()
-        document_type = "general"  # Default fallback
-
-        def show_classification_progress():
-            """Show animated progress for classification"""
-            spinner = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-            spinner_idx = 0
-            start_time = time.time()
-
-            while not classification_done.is_set():
-                elapsed = time.time() - start_time
-                message = f"├─ {spinner[spinner_idx]} Classifying document type ({elapsed:.1f}s)"
-                sys.stdout.write("\r" + message)
-                sys.stdout.flush()
-                spinner_idx = (spinner_idx + 1) % len(spinner)
-                time.sleep(0.1)
-
-            # Clear the line when done
-            sys.stdout.write("\r" + " " * 80 + "\r")
-            sys.stdout.flush()
-
-        # Start progress indicator
-        progress_thread = threading.Thread(target=show_classification_progress, daemon=True)
-        progress_thread.start()
-
-        # Perform classification
-        try:
-            document_type = await self._classify_document(truncated_content, article.title)
-        finally:
-            # Stop progress indicator
-            classification_done.set()
-            progress_thread.join(timeout=0.5)
-
-        # Show final result
-        sys.stdout.write(f"├─ Document type: {document_type}\n")
-        sys.stdout.flush()
-        logger.debug(f"Document classified as: {document_type}")
+        # Kick off classification without blocking extractor dispatch: the
+        # extractors only need the type when building their prompts, so they
+        # await this shared task themselves and classification overlaps their
+        # setup. Batch runs resolve instantly from the classify_many result.
+        async def classify() -> str:
+            document_type = self._classified_types.get(article.content_id)
+            if document_type is None:
+                self._progress.begin(article.content_id, "Classifying document type")
+                try:
+                    document_type = await self._classify_document(truncated_content, article.title)
+                finally:
+                    self._progress.end(article.content_id)
+            self._progress.write(f"├─ Document type: {document_type}")
+            logger.debug(f"Document classified as: {document_type}")
+            return document_type
+
+        classify_task = asyncio.create_task(classify())
 
         # Load existing status or create new
         status = self.status_store.load_status(article.content_id)
@@ -326,69 +516,27 @@ class ArticleProcessor:
         concept_count = 0
         relation_count = 0
 
+        # Re-run only processors that have not already succeeded, so a retry
+        # after partial failure pays for the failed extractors alone
+        pending_processors = [
+            name
+            for name in ("concepts", "relationships", "insights", "patterns")
+            if name not in status.processor_results or status.processor_results[name].status == "failed"
+        ]
+
         try:
-            if self.use_focused_extractors and self.focused_extractor:
+            if self.use_focused_extractors and self.focused_extractor and not pending_processors:
+                await classify_task
+                sys.stdout.write("├─ All extractors already succeeded, nothing to re-run\n")
+                sys.stdout.flush()
+            elif self.use_focused_extractors and self.focused_extractor:
                 # Use focused extractors for better quality
-                import threading
-
-                # Track extraction start time
                 extraction_start = time.time()
-
-                # Thread safety for output
-                output_lock = threading.Lock()
-
-                # Create a simple progress indicator thread
-                stop_progress = threading.Event()
                 completed_extractors = []
                 extractor_results = {}  # Store results with timing and counts
-
-                def show_progress():
-                    """Show a simple animated progress indicator with extractor status"""
-                    spinner = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-                    spinner_idx = 0
-                    last_update = time.time()
-                    prev_len = 0  # Track previous message length
-
-                    # Initial message
-                    with output_lock:
-                        message = "├─ Running 4 extractors in parallel (concepts, relationships, insights, patterns)..."
-                        sys.stdout.write(message)
-                        sys.stdout.flush()
-                        prev_len = len(message)
-
-                    while not stop_progress.is_set():
-                        current_time = time.time()
-                        elapsed = current_time - extraction_start
-
-                        # Update spinner every 0.3 seconds
-                        if current_time - last_update >= 0.3:
-                            with output_lock:
-                                # Only update if we're still running
-                                if len(completed_extractors) < 4:
-                                    message = f"├─ {spinner[spinner_idx]} Running 4 extractors in parallel (concepts, relationships, insights, patterns)... ({elapsed:.0f}s)"
-
-                                    # Clear the line first
-                                    clear_len = max(prev_len, len(message))
-                                    sys.stdout.write("\r" + " " * clear_len + "\r")
-
-                                    # Now write the new message
-                                    sys.stdout.write(message)
-                                    sys.stdout.flush()
-
-                                    prev_len = len(message)
-                                    spinner_idx = (spinner_idx + 1) % len(spinner)
-                                    last_update = current_time
-
-                        stop_progress.wait(0.1)  # Check every 100ms
-
-                    # Clear the progress line when done
-                    with output_lock:
-                        sys.stdout.write("\r" + " " * prev_len + "\r")
-                        sys.stdout.flush()
-
-                # Start progress indicator in background
-                progress_thread = threading.Thread(target=show_progress, daemon=True)
-                progress_thread.start()
+                progress_label = f"Running {len(pending_processors)} extractors in parallel ({', '.join(pending_processors)})"
+                extract_job = f"{article.content_id}:extract"
+                self._progress.begin(extract_job, progress_label)
 
                 # Run focused extractors (they run in parallel internally)
                 # We'll wrap this to track individual completions
@@ -398,196 +546,115 @@ class ArticleProcessor:
                         # Fallback to regular extract_all if focused_extractor is None
                         return {}
 
-                    # Start all extractors in parallel
-                    tasks = {
-                        "concepts": asyncio.create_task(
-                            self.focused_extractor.concept_extractor.extract(
-                                truncated_content, article.title, document_type
-                            )
-                        ),
-                        "relationships": asyncio.create_task(
-                            self.focused_extractor.relationship_extractor.extract(
-                                truncated_content, article.title, document_type
-                            )
-                        ),
-                        "insights": asyncio.create_task(
-                            self.focused_extractor.insight_extractor.extract(
-                                truncated_content, article.title, document_type
-                            )
-                        ),
-                        "patterns": asyncio.create_task(
-                            self.focused_extractor.pattern_extractor.extract(
-                                truncated_content, article.title, document_type
-                            )
-                        ),
+                    # Start the still-pending extractors in parallel
+                    extractors = {
+                        "concepts": self.focused_extractor.concept_extractor,
+                        "relationships": self.focused_extractor.relationship_extractor,
+                        "insights": self.focused_extractor.insight_extractor,
+                        "patterns": self.focused_extractor.pattern_extractor,
                     }
 
+                    async def run_extractor(name: str):
+                        """Wait for the shared classification, then extract"""
+                        # Awaiting a task caches its result, so only the first
+                        # extractor pays for classification; the rest resolve
+                        # immediately with the same value
+                        document_type = await classify_task
+                        return await extractors[name].extract(truncated_content, article.title, document_type)
+
+                    tasks = {name: asyncio.create_task(run_extractor(name)) for name in pending_processors}
+
                     # Import here to avoid circular dependencies
                     from amplifier.knowledge_synthesis.focused_extractors import FocusedExtractionResult
 
                     results = {}
 
-                    # Create a mapping of tasks to names for tracking
-                    task_to_name = {task: name for name, task in tasks.items()}
-
-                    # Use asyncio.as_completed to track completions as they happen
-                    for coro in asyncio.as_completed(tasks.values()):
-                        try:
-                            result = await coro
-                            # Find which task completed
-                            for task in tasks.values():
-                                if task.done() and task in task_to_name:
-                                    name = task_to_name[task]
-                                    if name not in completed_extractors:
-                                        results[name] = result
-                                        completed_extractors.append(name)
-
-                                        # Store result details
-                                        extractor_results[name] = {
-                                            "count": len(result.data) if result.data else 0,
-                                            "time": time.time() - extraction_start,
-                                            "success": True,
-                                        }
-
-                                        # Log individual completion with output lock
-                                        with output_lock:
-                                            elapsed = time.time() - extraction_start
-                                            count = len(result.data) if result.data else 0
-                                            # Clear current line and show completion
-                                            sys.stdout.write("\r" + " " * 120 + "\r")  # Clear line
-                                            sys.stdout.write(f"├─ ✓ {name} completed ({count} found, {elapsed:.1f}s)\n")
-                                            sys.stdout.flush()
-
-                                        del task_to_name[task]  # Remove from mapping
-                                        break
-                        except Exception as e:
-                            # Find which task failed
-                            for task in tasks.values():
-                                if task.done() and task in task_to_name:
-                                    name = task_to_name[task]
-                                    if name not in completed_extractors:
-                                        logger.error(f"Extraction {name} failed: {e}")
-                                        results[name] = FocusedExtractionResult(
-                                            extraction_type=name, data=[], extraction_time=0.0, error=str(e)
-                                        )
-                                        completed_extractors.append(name)
-
-                                        # Store failure details
-                                        extractor_results[name] = {
-                                            "count": 0,
-                                            "time": time.time() - extraction_start,
-                                            "success": False,
-                                            "error": str(e),
-                                        }
-
-                                        # Log failure with output lock
-                                        with output_lock:
-                                            elapsed = time.time() - extraction_start
-                                            # Clear current line and show failure
-                                            sys.stdout.write("\r" + " " * 120 + "\r")  # Clear line
-                                            sys.stdout.write(f"├─ ✗ {name} failed ({elapsed:.1f}s)\n")
-                                            # Show error details indented
-                                            error_str = str(e)
-                                            # Truncate very long error messages
-                                            if len(error_str) > 100:
-                                                error_str = error_str[:97] + "..."
-                                            sys.stdout.write(f"│  └─ {error_str}\n")
-                                            sys.stdout.flush()
-
-                                        del task_to_name[task]  # Remove from mapping
-                                        break
+                    # Handle each completion as it happens; asyncio.wait hands
+                    # back the finished tasks directly, so each one maps to its
+                    # name in O(1) instead of re-scanning the task set
+                    name_of = {task: name for name, task in tasks.items()}
+                    pending = set(tasks.values())
+
+                    while pending:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            name = name_of[task]
+                            elapsed = time.time() - extraction_start
+                            try:
+                                result = task.result()
+                            except Exception as e:
+                                logger.error(f"Extraction {name} failed: {e}")
+                                results[name] = FocusedExtractionResult(
+                                    extraction_type=name, data=[], extraction_time=0.0, error=str(e)
+                                )
+                                completed_extractors.append(name)
+
+                                # Store failure details
+                                extractor_results[name] = {
+                                    "count": 0,
+                                    "time": elapsed,
+                                    "success": False,
+                                    "error": str(e),
+                                }
+
+                                # Log failure with truncated error details
+                                error_str = str(e)
+                                if len(error_str) > 100:
+                                    error_str = error_str[:97] + "..."
+                                self._progress.write(f"├─ ✗ {name} failed ({elapsed:.1f}s)")
+                                self._progress.write(f"│  └─ {error_str}")
+                            else:
+                                results[name] = result
+                                completed_extractors.append(name)
+
+                                # Store result details
+                                count = len(result.data) if result.data else 0
+                                extractor_results[name] = {
+                                    "count": count,
+                                    "time": elapsed,
+                                    "success": True,
+                                }
+
+                                # Log individual completion
+                                self._progress.write(f"├─ ✓ {name} completed ({count} found, {elapsed:.1f}s)")
 
                     return results
 
-                extraction_results = await extract_with_tracking()
-
-                # Stop the progress indicator
-                stop_progress.set()
-                progress_thread.join(timeout=0.5)  # Wait briefly for thread to clean up
+                try:
+                    extraction_results = await extract_with_tracking()
+                finally:
+                    self._progress.end(extract_job)
 
                 # Don't show inner completion - let extraction_logger handle it
 
-                # Process results and update status (without redundant output)
-                # Process concepts
-                concept_result = extraction_results.get("concepts")
-                if concept_result and not concept_result.error:
-                    concepts = concept_result.data
-                    concept_count = len(concepts)
-                    extraction_data["concepts"] = concepts
-                    status.processor_results["concepts"] = ProcessorResult(
-                        processor_name="concepts",
-                        status="success" if concepts else "empty",
-                        extracted_count=concept_count,
-                    )
-                else:
-                    status.processor_results["concepts"] = ProcessorResult(
-                        processor_name="concepts",
-                        status="failed",
-                        error_message=concept_result.error if concept_result else "Unknown error",
-                    )
-
-                # Process relationships
-                relationship_result = extraction_results.get("relationships")
-                if relationship_result and not relationship_result.error:
-                    relationships = relationship_result.data
-                    relation_count = len(relationships)
-                    extraction_data["relationships"] = relationships
-                    status.processor_results["relationships"] = ProcessorResult(
-                        processor_name="relationships",
-                        status="success" if relationships else "empty",
-                        extracted_count=relation_count,
-                    )
-                else:
-                    status.processor_results["relationships"] = ProcessorResult(
-                        processor_name="relationships",
-                        status="failed",
-                        error_message=relationship_result.error if relationship_result else "Unknown error",
-                    )
-
-                # Process insights
-                insight_result = extraction_results.get("insights")
-                if insight_result and not insight_result.error:
-                    insights = insight_result.data
-                    insight_count = len(insights)
-                    extraction_data["insights"] = insights
-                    status.processor_results["insights"] = ProcessorResult(
-                        processor_name="insights",
-                        status="success" if insights else "empty",
-                        extracted_count=insight_count,
-                    )
-                else:
-                    status.processor_results["insights"] = ProcessorResult(
-                        processor_name="insights",
-                        status="failed",
-                        error_message=insight_result.error if insight_result else "Unknown error",
-                    )
-
-                # Process patterns
-                pattern_result = extraction_results.get("patterns")
-                if pattern_result and not pattern_result.error:
-                    patterns = pattern_result.data
-                    pattern_count = len(patterns)
-                    extraction_data["patterns"] = patterns
-                    status.processor_results["patterns"] = ProcessorResult(
-                        processor_name="patterns",
-                        status="success" if patterns else "empty",
-                        extracted_count=pattern_count,
-                    )
-                else:
-                    status.processor_results["patterns"] = ProcessorResult(
-                        processor_name="patterns",
-                        status="failed",
-                        error_message=pattern_result.error if pattern_result else "Unknown error",
-                    )
-
-                # Check if all processors succeeded
-                status.is_complete = all(r.status in ["success", "empty"] for r in status.processor_results.values())
+                # Process results and update status (without redundant output);
+                # processors skipped above keep their previous results
+                for name in pending_processors:
+                    result = extraction_results.get(name)
+                    if result and not result.error:
+                        extraction_data[name] = result.data
+                        status.processor_results[name] = ProcessorResult(
+                            processor_name=name,
+                            status="success" if result.data else "empty",
+                            extracted_count=len(result.data),
+                        )
+                    else:
+                        status.processor_results[name] = ProcessorResult(
+                            processor_name=name,
+                            status="failed",
+                            error_message=result.error if result else "Unknown error",
+                        )
+
+                concept_count = len(extraction_data.get("concepts", []))
+                relation_count = len(extraction_data.get("relationships", []))
 
             elif self.extractor:
                 # Use unified extractor (old behavior)
                 self.extraction_logger.start_phase("Unified Extraction")
                 phase_start = time.time()
 
+                document_type = await classify_task
+
                 async with asyncio.timeout(120):  # 120 seconds per DISCOVERIES.md
                     extraction = await self.extractor.extract_from_text(
                         text=truncated_content,
@@ -639,8 +706,6 @@ class ArticleProcessor:
                     status="success" if extraction.code_patterns else "empty",
                     extracted_count=len(extraction.code_patterns) if extraction.code_patterns else 0,
                 )
-
-                status.is_complete = True
             else:
                 raise RuntimeError("No extractor available")
 
@@ -653,9 +718,27 @@ class ArticleProcessor:
                         processor_name=processor_name, status="failed", error_message=str(e)
                     )
 
+        finally:
+            # Failure paths can bail out before any extractor awaits the shared
+            # classification; cancel and drain it so it neither keeps an LLM
+            # call running nor warns that its exception was never retrieved
+            if not classify_task.done():
+                classify_task.cancel()
+            try:
+                await classify_task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+        # Complete when every processor has succeeded or is legitimately empty
+        status.is_complete = bool(status.processor_results) and all(
+            r.status in ["success", "empty"] for r in status.processor_results.values()
+        )
+
         # Save status after processing
         status.last_processed = datetime.now()
         self.status_store.save_status(status)
+        if self._status_cache is not None:
+            self._status_cache[status.article_id] = status
 
         # Save extracted data if we have any
         if extraction_data:
@@ -669,6 +752,50 @@ class ArticleProcessor:
 
         return status
 
+    async def process_articles(
+        self, articles: list[ContentItem], concurrency: int = 4
+    ) -> list[ArticleProcessingStatus]:
+        """Process several articles concurrently with bounded in-flight work.
+
+        LLM round-trips dominate per-article time and are independent across
+        articles, so a small pool of concurrent articles hides that latency
+        without hammering provider rate limits. Each article still saves its
+        own status and extraction files as it completes, and one failed
+        article does not stop the rest.
+
+        Args:
+            articles: Articles to process
+            concurrency: Maximum articles in flight at once
+
+        Returns:
+            Processing statuses for the articles that completed
+        """
+        truncations = batch_truncate_to_tokens([article.content for article in articles])
+        await self.classify_many(articles)
+
+        semaphore = asyncio.Semaphore(concurrency)
+        total = len(articles)
+
+        async def process_one(idx: int, article: ContentItem, truncation: tuple[str, int, int]):
+            async with semaphore:
+                return await self.process_article_with_logging(article, idx, total, truncation)
+
+        results = await asyncio.gather(
+            *(
+                process_one(idx, article, truncation)
+                for idx, (article, truncation) in enumerate(zip(articles, truncations, strict=True), 1)
+            ),
+            return_exceptions=True,
+        )
+
+        statuses = []
+        for article, result in zip(articles, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Processing failed for {article.title}: {result}")
+            else:
+                statuses.append(result)
+        return statuses
+
     def _save_extraction_data(self, article_id: str, data: dict[str, Any]) -> None:
         """Save extracted data in both formats for compatibility.
 
@@ -681,21 +808,29 @@ class ArticleProcessor:
         extractions_dir.mkdir(parents=True, exist_ok=True)
 
         # Save to JSON file
-        safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in article_id)
+        safe_id = _UNSAFE_ID_CHARS.sub("_", article_id)
         output_file = extractions_dir / f"{safe_id}.json"
 
-        # Save with timestamp
+        # Merge with any previous extraction so a partial re-run (only failed
+        # processors re-execute) keeps the sections that already succeeded
+        if output_file.exists():
+            try:
+                previous = json.loads(output_file.read_text()).get("data", {})
+                previous.update(data)
+                data = previous
+            except Exception as e:
+                logger.warning(f"Could not merge previous extraction for {article_id}: {e}")
+
+        # Save with timestamp; compact form since these files are read by
+        # tools, not people, and indentation roughly doubles the bytes written
         save_data = {"article_id": article_id, "extracted_at": datetime.now().isoformat(), "data": data}
 
-        output_file.write_text(json.dumps(save_data, indent=2, ensure_ascii=False))
+        output_file.write_text(_json_dumps(save_data))
 
         # Secondary: Append to JSONL (non-critical - failures are logged but don't stop processing)
         try:
             jsonl_data = self._transform_to_jsonl_format(article_id, data)
-            jsonl_path = paths.data_dir / "knowledge" / "extractions.jsonl"
-            jsonl_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(jsonl_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(jsonl_data, ensure_ascii=False) + "\n")
+            self._jsonl_fh.write(_json_dumps(jsonl_data) + "\n")
             logger.debug(f"Dual-write complete for {article_id}")
         except Exception as e:
             logger.warning(f"JSONL write failed for {article_id}: {e}")
@@ -749,13 +884,19 @@ class ArticleProcessor:
                 elif result.processor_name == "patterns":
                     self.stats["total_patterns"] += result.extracted_count
 
+    def _all_statuses(self) -> list[ArticleProcessingStatus]:
+        """Return all known statuses, reading the store only on first use."""
+        if self._status_cache is None:
+            self._status_cache = {s.article_id: s for s in self.status_store.get_all_statuses()}
+        return list(self._status_cache.values())
+
     def get_processing_report(self) -> dict[str, Any]:
         """Get comprehensive processing report.
 
         Returns:
             Report with statistics and details
         """
-        all_statuses = self.status_store.get_all_statuses()
+        all_statuses = self._all_statuses()
 
         # Categorize articles
         complete = []
@@ -822,17 +963,29 @@ class ArticleProcessor:
         total = len(articles)
         logger.info(f"Processing batch of {total} articles")
 
-        try:
-            for idx, article in enumerate(articles, 1):
-                # Check if already processed
-                existing_status = self.status_store.load_status(article.content_id)
+        # Drop already-complete articles first so the batch tokenizer only
+        # sees content that will actually be processed
+        to_process = []
+        for article in articles:
+            existing_status = self.status_store.load_status(article.content_id)
+
+            if existing_status and existing_status.is_complete and not retry_failed:
+                logger.info(f"Skipping already complete: {article.title}")
+                continue
 
-                if existing_status and existing_status.is_complete and not retry_failed:
-                    logger.info(f"Skipping already complete: {article.title}")
-                    continue
+            to_process.append(article)
 
+        # One tokenizer call for the whole batch instead of one per article
+        truncations = batch_truncate_to_tokens([article.content for article in to_process])
+
+        # Classify everything up front so per-article processing never blocks
+        # on a classification round-trip
+        await self.classify_many(to_process)
+
+        try:
+            for idx, (article, truncation) in enumerate(zip(to_process, truncations, strict=True), 1):
                 # Process or reprocess
-                await self.process_article_with_logging(article, idx, total)
+                await self.process_article_with_logging(article, idx, len(to_process), truncation)
 
         except KeyboardInterrupt:
             if notify:
@@ -7,6 +7,14 @@ to fit within token limits for LLM processing.
 import tiktoken
 
 
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """Resolve a tiktoken encoding, falling back to cl100k_base if unknown."""
+    try:
+        return tiktoken.get_encoding(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def count_tokens(text: str, model: str = "cl100k_base") -> int:
     """Count the number of tokens in text.
 
@@ -17,13 +25,7 @@ def count_tokens(text: str, model: str = "cl100k_base") -> int:
     Returns:
         Number of tokens in the text
     """
-    try:
-        encoding = tiktoken.get_encoding(model)
-    except KeyError:
-        # Fallback to cl100k_base if model not found
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-    return len(encoding.encode(text))
+    return len(_get_encoding(model).encode(text))
 
 
 def truncate_to_tokens(text: str, max_tokens: int = 80000, model: str = "cl100k_base") -> tuple[str, int, int]:
@@ -37,11 +39,7 @@ def truncate_to_tokens(text: str, max_tokens: int = 80000, model: str = "cl100k_
     Returns:
         Tuple of (truncated_text, original_token_count, final_token_count)
     """
-    try:
-        encoding = tiktoken.get_encoding(model)
-    except KeyError:
-        # Fallback to cl100k_base if model not found
-        encoding = tiktoken.get_encoding("cl100k_base")
+    encoding = _get_encoding(model)
 
     # Encode the text to tokens
     tokens = encoding.encode(text)
@@ -57,3 +55,32 @@ def truncate_to_tokens(text: str, max_tokens: int = 80000, model: str = "cl100k_
     final_count = len(truncated_tokens)
 
     return truncated_text, original_count, final_count
+
+
+def batch_truncate_to_tokens(
+    texts: list[str], max_tokens: int = 80000, model: str = "cl100k_base"
+) -> list[tuple[str, int, int]]:
+    """Truncate a batch of texts in a single tokenizer call.
+
+    encode_batch tokenizes across threads in tiktoken's Rust core, so one call
+    over N documents is much cheaper than N single-string round trips.
+
+    Args:
+        texts: The texts to potentially truncate
+        max_tokens: Maximum number of tokens allowed per text (default: 80000)
+        model: The tiktoken encoding model to use
+
+    Returns:
+        List of (truncated_text, original_token_count, final_token_count), in input order
+    """
+    encoding = _get_encoding(model)
+
+    results = []
+    for text, tokens in zip(texts, encoding.encode_batch(texts), strict=True):
+        original_count = len(tokens)
+        if original_count <= max_tokens:
+            results.append((text, original_count, original_count))
+        else:
+            results.append((encoding.decode(tokens[:max_tokens]), original_count, max_tokens))
+
+    return results